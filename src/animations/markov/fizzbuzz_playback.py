@@ -1,5 +1,9 @@
 from manim import *
 import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from simulation.formats import load_results
 import ast
 
 DATA_FILE = "../results/results_markov_vs_fizzbuzz.csv"
@@ -17,7 +21,7 @@ ALL_MOVES = ["R", "P", "S"]
 
 class RPSPlayback(Scene):
     def construct(self):
-        df = pd.read_csv(DATA_FILE).head(SHOW_ROUNDS)
+        df = load_results(DATA_FILE).head(SHOW_ROUNDS)
 
         # Title
         title = Text("Markov vs FizzBuzz (2k rounds)", font_size=36)
@@ -1,32 +1,33 @@
-import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
 import matplotlib.pyplot as plt
+from simulation.sampled import load_rolling
 
 # -------- CONFIG ----------------------------------------------------
 CSV_PATH = "results/results_qlearning_vs_qlearning.csv"
-ROLLING_WINDOW = 500
+ROLLING_WINDOW = 500  # rounds, also for sampled logs (read from their blocks file)
+DOWNSAMPLE = 100  # plot about every Nth round to reduce clutter
 # --------------------------------------------------------------------
 
 def main():
-    repdf = pd.read_csv(CSV_PATH)
-
+    # Rolling counts and run totals, from every row or from the blocks of a sampled log
     dfs = [
-        ("QLearning", repdf),
+        ("QLearning", load_rolling(CSV_PATH, ROLLING_WINDOW, DOWNSAMPLE)),
     ]
 
     # Compute rolling winrates
-    for _, df in dfs:
-        df["is_win"] = df["result"] == "win"
-        df["rolling_winrate"] = df["is_win"].rolling(ROLLING_WINDOW).mean()
+    for _, (df, _) in dfs:
+        df["rolling_winrate"] = df["wins"] / df["rounds"]
 
     plt.figure(figsize=(12, 7))  # slightly taller for table room
 
-    DOWNSAMPLE = 100  # plot every Nth point to reduce clutter
-
     # Plot lines
-    for name, df in dfs:
+    for name, (df, _) in dfs:
         plt.plot(
-            df["round"].iloc[::DOWNSAMPLE],
-            df["rolling_winrate"].iloc[::DOWNSAMPLE],
+            df["round"],
+            df["rolling_winrate"],
             label=name,
             linewidth=2
         )
@@ -41,9 +42,9 @@ def main():
     # ---- Ending rolling winrate table ----
     # Build table data
     table_data = []
-    for name, df in dfs:
-        overall_winrate = df["is_win"].mean()
-        overall_tierate = (df["result"] == "tie").mean()
+    for name, (_, totals) in dfs:
+        overall_winrate = totals["wins"] / totals["rounds"] if totals["rounds"] else 0
+        overall_tierate = totals["ties"] / totals["rounds"] if totals["rounds"] else 0
         table_data.append([name, f"{overall_winrate:.3f}", f"{overall_tierate:.3f}"])
 
     # Add table to plot
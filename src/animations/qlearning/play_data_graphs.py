@@ -1,5 +1,9 @@
-import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
 import matplotlib.pyplot as plt
+from simulation.sampled import load_rolling
 
 # -------- CONFIG ----------------------------------------------------
 REPEATER_CSV_PATH = "results/results_qlearning_vs_repeater.csv"
@@ -7,46 +11,31 @@ FIZZBUZZ_CSV_PATH = "results/results_qlearning_vs_fizzbuzz.csv"
 COUNTER_CSV_PATH = "results/results_qlearning_vs_counter.csv"
 RANDOM_CSV_PATH = "results/results_qlearning_vs_random.csv"
 SLIGHTBIAS_CSV_PATH = "results/results_qlearning_vs_slightbias.csv"
-ROLLING_WINDOW = 500
+ROLLING_WINDOW = 500  # rounds, also for sampled logs (read from their blocks file)
+DOWNSAMPLE = 100  # plot about every Nth round to reduce clutter
 # --------------------------------------------------------------------
 
 def main():
-    repdf = pd.read_csv(REPEATER_CSV_PATH)
-    fbdf = pd.read_csv(FIZZBUZZ_CSV_PATH)
-    codf = pd.read_csv(COUNTER_CSV_PATH)
-    randf = pd.read_csv(RANDOM_CSV_PATH)
-    sbdf = pd.read_csv(SLIGHTBIAS_CSV_PATH)
-
+    # Rolling counts and run totals, from every row or from the blocks of a sampled log
     dfs = [
-        ("Repeater", repdf),
-        ("FizzBuzz", fbdf),
-        ("Counter", codf),
-        ("Random", randf),
-        ("SlightBias", sbdf)
+        ("Repeater", load_rolling(REPEATER_CSV_PATH, ROLLING_WINDOW, DOWNSAMPLE)),
+        ("FizzBuzz", load_rolling(FIZZBUZZ_CSV_PATH, ROLLING_WINDOW, DOWNSAMPLE)),
+        ("Counter", load_rolling(COUNTER_CSV_PATH, ROLLING_WINDOW, DOWNSAMPLE)),
+        ("Random", load_rolling(RANDOM_CSV_PATH, ROLLING_WINDOW, DOWNSAMPLE)),
+        ("SlightBias", load_rolling(SLIGHTBIAS_CSV_PATH, ROLLING_WINDOW, DOWNSAMPLE))
     ]
 
     # Compute WIN/LOSS ONLY rolling winrates
-    for _, df in dfs:
-        df["is_win"]  = (df["result"] == "win").astype(int)
-        df["is_loss"] = (df["result"] == "lose").astype(int)
-        df["is_tie"]  = (df["result"] == "tie")
-
+    for _, (df, _) in dfs:
         # Correct rolling winrate: W / (W+L), ties excluded
-        wins  = df["is_win"].rolling(ROLLING_WINDOW).sum()
-        losses = df["is_loss"].rolling(ROLLING_WINDOW).sum()
-        denom = wins + losses
-
-        df["rolling_winrate"] = (wins / denom).fillna(0)
+        denom = df["wins"] + df["losses"]
+        df["rolling_winrate"] = (df["wins"] / denom).fillna(0)
 
     plt.figure(figsize=(14, 8))
 
-    DOWNSAMPLE = 100
-
     # Plot rolling winrates
-    for name, df in dfs:
-        y = df["rolling_winrate"].iloc[::DOWNSAMPLE]
-        x = df["round"].iloc[y.index]
-        plt.plot(x, y, label=name, linewidth=2)
+    for name, (df, _) in dfs:
+        plt.plot(df["round"], df["rolling_winrate"], label=name, linewidth=2)
 
     plt.title(f"QLearning Rolling Win Rate (wins vs losses only, window={ROLLING_WINDOW})")
     plt.xlabel("Round")
@@ -57,9 +46,9 @@ def main():
 
     # ---- TABLE 1: Winrate (excluding ties) ----
     win_table_data = []
-    for name, df in dfs:
-        total_wins = df["is_win"].sum()
-        total_losses = df["is_loss"].sum()
+    for name, (_, totals) in dfs:
+        total_wins = totals["wins"]
+        total_losses = totals["losses"]
         winrate = total_wins / (total_wins + total_losses) if (total_wins + total_losses) > 0 else 0
         win_table_data.append([name, f"{winrate:.3f}"])
 
@@ -73,8 +62,8 @@ def main():
 
     # ---- TABLE 2: Tie Rate ----
     tie_table_data = []
-    for name, df in dfs:
-        tie_rate = df["is_tie"].mean()
+    for name, (_, totals) in dfs:
+        tie_rate = totals["ties"] / totals["rounds"] if totals["rounds"] else 0
         tie_table_data.append([name, f"{tie_rate:.3f}"])
 
     plt.table(
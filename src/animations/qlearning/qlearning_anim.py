@@ -1,6 +1,9 @@
 from manim import *
 import pandas as pd
+import sys
 import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from simulation.formats import load_results
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -28,17 +31,15 @@ class RPSQLearningPlayback(Scene):
     def construct(self):
         TRAIN_FILE = os.path.join("results", f"training_{self.predictor}_vs_{self.opponent}.csv")
 
+        # CSV paths also find the Parquet/Feather version of the same run
         train_df = None
-        if os.path.exists(TRAIN_FILE):
-            train_df = pd.read_csv(TRAIN_FILE)
-        else:
+        try:
+            train_df = load_results(TRAIN_FILE)
+        except FileNotFoundError:
             print("Warning: No training CSV found. Skipping training animation.")
 
-        # Load data safely
-        if not os.path.exists(self.data_file):
-            raise FileNotFoundError(f"CSV not found: {self.data_file}")
-
-        df = pd.read_csv(self.data_file).head(SHOW_ROUNDS)
+        # Load data safely (raises FileNotFoundError if the run is missing)
+        df = load_results(self.data_file).head(SHOW_ROUNDS)
 
         # Title
         title = Text(f"{self.predictor.capitalize()} vs {self.opponent.capitalize()} ({SHOW_ROUNDS} rounds)", font_size=36)
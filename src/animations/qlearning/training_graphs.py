@@ -1,5 +1,9 @@
-import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
 import matplotlib.pyplot as plt
+from simulation.sampled import load_rolling
 
 # -------- CONFIG ----------------------------------------------------
 REPEATER_CSV_PATH = "results/training_qlearning_vs_repeater.csv"
@@ -7,39 +11,26 @@ FIZZBUZZ_CSV_PATH = "results/training_qlearning_vs_fizzbuzz.csv"
 COUNTER_CSV_PATH = "results/training_qlearning_vs_counter.csv"
 RANDOM_CSV_PATH = "results/training_qlearning_vs_random.csv"
 SLIGHTBIAS_CSV_PATH = "results/training_qlearning_vs_slightbias.csv"
-ROLLING_WINDOW = 500
+ROLLING_WINDOW = 500  # rounds, also for sampled logs (read from their blocks file)
 # --------------------------------------------------------------------
 
 def main():
-    repdf = pd.read_csv(REPEATER_CSV_PATH)
-    fbdf = pd.read_csv(FIZZBUZZ_CSV_PATH)
-    codf = pd.read_csv(COUNTER_CSV_PATH)
-    randf = pd.read_csv(RANDOM_CSV_PATH)
-    sbdf = pd.read_csv(SLIGHTBIAS_CSV_PATH)
-
+    # Rolling counts over the window, from every row or from the blocks of a sampled log
     dfs = [
-        ("Repeater", repdf),
-        ("FizzBuzz", fbdf),
-        ("Counter", codf),
-        ("Random", randf),
-        ("SlightBias", sbdf)
+        ("Repeater", load_rolling(REPEATER_CSV_PATH, ROLLING_WINDOW)[0]),
+        ("FizzBuzz", load_rolling(FIZZBUZZ_CSV_PATH, ROLLING_WINDOW)[0]),
+        ("Counter", load_rolling(COUNTER_CSV_PATH, ROLLING_WINDOW)[0]),
+        ("Random", load_rolling(RANDOM_CSV_PATH, ROLLING_WINDOW)[0]),
+        ("SlightBias", load_rolling(SLIGHTBIAS_CSV_PATH, ROLLING_WINDOW)[0])
     ]
 
     # Compute rolling winrates excluding ties
     for _, df in dfs:
-        df["is_win"] = (df["result"] == "win").astype(int)
-        df["is_loss"] = (df["result"] == "lose").astype(int)
-        df["is_tie"] = (df["result"] == "tie").astype(int)
-
-        df["is_wl"] = df["is_win"] + df["is_loss"]
-
         # Rolling winrate = wins / (wins+losses)
-        wins_roll = df["is_win"].rolling(ROLLING_WINDOW).sum()
-        wl_roll = df["is_wl"].rolling(ROLLING_WINDOW).sum()
-        df["rolling_winrate"] = wins_roll / wl_roll
+        df["rolling_winrate"] = df["wins"] / (df["wins"] + df["losses"])
 
         # Rolling tie rate
-        df["rolling_tierate"] = df["is_tie"].rolling(ROLLING_WINDOW).mean()
+        df["rolling_tierate"] = df["ties"] / df["rounds"]
 
     plt.figure(figsize=(14, 8))
 
@@ -16,6 +16,79 @@ class RPSGame:
         self.player = player
         self.predictor = predictor
         self.round_number = 0
+        # Headless scoreboard (AI perspective), see play_round
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+
+    def play_round(self) -> dict:
+        '''
+        Plays one round without any console I/O.
+        The player must be a simulated one (not HumanPlayer).
+        Returns the round record, same columns as the simulation CSVs.
+        '''
+        player_move = self.player.get_move_idx()
+        ai_move = self.predictor.predict_idx()
+        self.predictor.update_idx(player_move, ai_move)
+        self.player.observe_idx(ai_move)
+
+        self.round_number += 1
+        result = (ai_move - player_move) % 3
+        if result == 1:
+            self.wins += 1
+        elif result == 2:
+            self.losses += 1
+        else:
+            self.ties += 1
+
+        moves = self.predictor.MOVES
+        return {
+            "round": self.round_number,
+            "model_move": moves[ai_move],
+            "opponent_move": moves[player_move],
+            "model_prediction": moves[(ai_move + 2) % 3],
+            "result": self.predictor.RESULTS[result],
+            "cum_model_wins": self.wins,
+            "cum_player_wins": self.losses,
+            "cum_ties": self.ties,
+        }
+
+    def play_batch(self, n: int, keep_records: bool = True) -> dict:
+        '''
+        Plays n headless rounds.
+        Returns the outcome counts of the batch and, if keep_records,
+        the per-round records from play_round.
+        '''
+        wins, losses, ties = self.wins, self.losses, self.ties
+        records = []
+
+        if keep_records:
+            for _ in range(n):
+                records.append(self.play_round())
+        else:
+            # Same round as play_round, minus building the record
+            player, predictor = self.player, self.predictor
+            for _ in range(n):
+                player_move = player.get_move_idx()
+                ai_move = predictor.predict_idx()
+                predictor.update_idx(player_move, ai_move)
+                player.observe_idx(ai_move)
+
+                result = (ai_move - player_move) % 3
+                if result == 1:
+                    self.wins += 1
+                elif result == 2:
+                    self.losses += 1
+                else:
+                    self.ties += 1
+            self.round_number += n
+
+        return {
+            'player_wins': self.losses - losses,
+            'predictor_wins': self.wins - wins,
+            'ties': self.ties - ties,
+            'records': records,
+        }
 
     def play_interactive(self, rounds: int = 0):
         '''
@@ -129,6 +202,7 @@ class RPSGame:
 
         # Reset round counter
         self.round_number = 0
+        self.wins = self.losses = self.ties = 0
 
         if hasattr(self.predictor, "reset"):
             self.predictor.reset()
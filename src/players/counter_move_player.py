@@ -1,22 +1,34 @@
 from .player import Player
-import random
+from predictors.rng import RngLike
+import numpy as np
 
 class CounterMovePlayer(Player):
     # player that plays the move that beats the opponent's last move
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng: RngLike = None):
+        super().__init__(rng)
         self.last_opponent_move = None
 
     def observe(self, opponent_move: str):
+        self.observe_idx(self.MOVE_TO_IDX[opponent_move])
+
+    def observe_idx(self, opponent_move: int):
         self.last_opponent_move = opponent_move
 
     def get_move(self) -> str:
-        if self.last_opponent_move == 'R':
-            return 'P'
-        elif self.last_opponent_move == 'P':
-            return 'S'
-        elif self.last_opponent_move == 'S':
-            return 'R'
-        else:
-            return random.choice(['R', 'P', 'S'])
\ No newline at end of file
+        return self.MOVES[self.get_move_idx()]
+
+    def get_move_idx(self) -> int:
+        if self.last_opponent_move is None:
+            return self.rng.randrange(3)
+        # (m + 1) % 3 beats m: R -> P, P -> S, S -> R
+        return (self.last_opponent_move + 1) % 3
+
+    def get_move_batch(self, n: int, opponent_moves: np.ndarray) -> np.ndarray:
+        if n == 0:
+            return np.empty(0, dtype=np.int8)
+        moves = np.empty(n, dtype=np.int8)
+        moves[0] = self.get_move_idx()
+        moves[1:] = (opponent_moves[:-1] + 1) % 3
+        self.last_opponent_move = int(opponent_moves[-1])
+        return moves
\ No newline at end of file
@@ -1,25 +1,38 @@
 from .player import Player
-import random
+from predictors.rng import RngLike, numpy_rng
+import numpy as np
 
 class FizzBuzzPlayer(Player):
     """
     Plays moves based on FizzBuzz pattern 
     """
     
-    MOVES = ['R', 'P', 'S']
-    
-    def __init__(self):
+    def __init__(self, rng: RngLike = None):
+        super().__init__(rng)
         self.round_num = 0
     
     def get_move(self) -> str:
+        return self.MOVES[self.get_move_idx()]
+
+    def get_move_idx(self) -> int:
         self.round_num += 1
         
         # Or you can do num % 15 == 0
         if self.round_num % 3 == 0 and self.round_num % 5 == 0:
-            return 'S'
+            return 2  # S
         elif self.round_num % 3 == 0:
-            return 'R'
+            return 0  # R
         elif self.round_num % 5 == 0:
-            return 'P'
+            return 1  # P
         else:
-            return random.choice(self.MOVES)
\ No newline at end of file
+            return self.rng.randrange(3)
+
+    def get_move_batch(self, n: int, opponent_moves=None) -> np.ndarray:
+        rounds = np.arange(self.round_num + 1, self.round_num + n + 1)
+        self.round_num += n
+
+        moves = numpy_rng(self.rng).integers(0, 3, n, dtype=np.int8)
+        moves[rounds % 3 == 0] = 0   # R
+        moves[rounds % 5 == 0] = 1   # P
+        moves[rounds % 15 == 0] = 2  # S
+        return moves
\ No newline at end of file
@@ -1,6 +1,7 @@
 from .player import Player
 from predictors.markov_predictor import MarkovPredictor
-import random
+from predictors.history import MoveHistory
+from predictors.rng import RngLike
 
 class MarkovPlayer(Player):
     """
@@ -10,23 +11,30 @@ class MarkovPlayer(Player):
     This is essentially a "Markov AI Player" that learns patterns.
     """
     
-    MOVES = ['R', 'P', 'S']
-    
-    def __init__(self, order: int = 4):
-        self.predictor = MarkovPredictor(order=order)
-        self.opponent_history = []
+    def __init__(self, order: int = 4, rng: RngLike = None):
+        super().__init__(rng)
+        # The inner predictor draws from the player's stream
+        self.predictor = MarkovPredictor(order=order, rng=self.rng)
+        # Only the last order + 1 moves are ever needed
+        self.opponent_history = MoveHistory(maxlen=order + 1)
         self.last_move = None
         self.order = order
     
     def get_move(self) -> str:
-        move = self.predictor.predict()
+        return self.MOVES[self.get_move_idx()]
+
+    def get_move_idx(self) -> int:
+        move = self.predictor.predict_idx()
         
         self.last_move = move
         return move
     
     def observe(self, opponent_move: str):
+        self.observe_idx(self.MOVE_TO_IDX[opponent_move])
+
+    def observe_idx(self, opponent_move: int):
         self.opponent_history.append(opponent_move)
         
         # Update the predictor 
-        if self.last_move:
-            self.predictor.update(opponent_move, self.last_move)
\ No newline at end of file
+        if self.last_move is not None:
+            self.predictor.update_idx(opponent_move, self.last_move)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from .player import Player
-import random
+from predictors.rng import RngLike
 from typing import Any, Dict, Optional
 
 class ModelAgent(Player):
@@ -8,16 +8,37 @@ class ModelAgent(Player):
     The model may be:
       - a callable(my_history, opp_history) -> label or probs
       - an object with predict / predict_proba / update / partial_fit
+      - an RPSPredictor (predict_idx / update_idx): it plays its own
+        counter move and learns from the opponent's moves
     """
-    def __init__(self, model: Any, deterministic: bool = False, action_space=('R','P','S')):
-        super().__init__()
+    def __init__(self, model: Any, deterministic: bool = False, action_space=('R','P','S'),
+                 rng: RngLike = None):
+        super().__init__(rng)
         self.model = model
         self.deterministic = deterministic
         self.action_space = list(action_space)
         self.my_history = []
         self.opp_history = []
+        # Predictors already pick a move, no need to go through labels
+        self.is_predictor = callable(getattr(model, "predict_idx", None)) \
+            and callable(getattr(model, "update_idx", None))
+        self.last_move = None
+
+    def get_move_idx(self) -> int:
+        if not self.is_predictor:
+            return super().get_move_idx()
+        self.last_move = self.model.predict_idx()
+        return self.last_move
+
+    def observe_idx(self, opponent_move: int):
+        if not self.is_predictor:
+            return super().observe_idx(opponent_move)
+        if self.last_move is not None:
+            self.model.update_idx(opponent_move, self.last_move)
 
     def get_move(self) -> str:
+        if self.is_predictor:
+            return self.MOVES[self.get_move_idx()]
         out = None
         try:
             if callable(self.model):
@@ -39,11 +60,11 @@ class ModelAgent(Player):
             weights = [probs[c] for c in choices]
             s = sum(weights)
             if s <= 0:
-                return random.choice(self.action_space)
+                return self.rng.choice(self.action_space)
             weights = [w / s for w in weights]
-            return random.choices(choices, weights)[0]
+            return self.rng.choices(choices, weights)[0]
 
-        return random.choice(self.action_space)
+        return self.rng.choice(self.action_space)
 
     def _interpret_output(self, out: Any) -> Optional[Dict[str, float]]:
         if out is None:
@@ -83,6 +104,10 @@ class ModelAgent(Player):
         Record opponent move (and optionally my move) and update the model.
         Signature matches Player.observe(opponent_move) but also accepts my_move.
         """
+        if self.is_predictor:
+            if opponent_move:
+                self.observe_idx(self.MOVE_TO_IDX[opponent_move])
+            return
         if my_move:
             self.my_history.append(my_move)
         if opponent_move:
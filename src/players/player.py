@@ -1,10 +1,31 @@
 from abc import ABC, abstractmethod
+from predictors.rng import RngLike, make_rng
 
 class Player(ABC):
+    # Moves are encoded as R = 0, P = 1, S = 2 (same as RPSPredictor)
+    MOVES: tuple[str, str, str] = ('R', 'P', 'S')
+    MOVE_TO_IDX = {'R': 0, 'P': 1, 'S': 2}
+
+    # rng: seed for the player's own random stream (see predictors/rng.py)
+    def __init__(self, rng: RngLike = None):
+        self.rng = make_rng(rng)
 
     @abstractmethod
     def get_move(self) -> str:
         pass
 
     def observe(self, opponent_move: str):
-        pass
\ No newline at end of file
+        pass
+
+    # Optional: get_move_batch(n, opponent_moves) -> np.ndarray
+    # Players whose moves don't depend on the opponent (or only on the
+    # opponent's previous moves) can return n moves at once given the
+    # opponent's n moves, see simulation/vectorized.py.
+
+    # Integer versions used by the simulation loops. Simulated players
+    # override these directly; the defaults convert at the string edge.
+    def get_move_idx(self) -> int:
+        return self.MOVE_TO_IDX[self.get_move()]
+
+    def observe_idx(self, opponent_move: int):
+        self.observe(self.MOVES[opponent_move])
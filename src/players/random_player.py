@@ -1,17 +1,27 @@
 from .player import Player
-import random
+from predictors.rng import RngLike, numpy_rng
+import numpy as np
 
 class RandomPlayer(Player):
     # Just plays a random move
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng: RngLike = None):
+        super().__init__(rng)
 
     def get_move(self) -> str:
-        return random.choice(['R', 'P', 'S'])
+        return self.MOVES[self.get_move_idx()]
+
+    def get_move_idx(self) -> int:
+        return self.rng.randrange(3)
+
+    def get_move_batch(self, n: int, opponent_moves=None) -> np.ndarray:
+        return numpy_rng(self.rng).integers(0, 3, n, dtype=np.int8)
     
     def observe(self, opponent_move: str):
         pass
 
+    def observe_idx(self, opponent_move: int):
+        pass
+
 if __name__ == "__main__":
     player = RandomPlayer()
 
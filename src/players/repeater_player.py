@@ -1,19 +1,41 @@
 from .player import Player
-import random
+from predictors.rng import RngLike, numpy_rng
+import numpy as np
 
 class RepeaterPlayer(Player):
     # A player that prefers to repeat its last move.
     rep_preference = 0.5 # Probability to repeat last move
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng: RngLike = None):
+        super().__init__(rng)
         self.last_move = None
 
     def get_move(self) -> str:
-        if self.last_move is not None and random.random() < self.rep_preference:
+        return self.MOVES[self.get_move_idx()]
+
+    def get_move_idx(self) -> int:
+        if self.last_move is not None and self.rng.random() < self.rep_preference:
             move = self.last_move
         else:
-            move = random.choice(['R', 'P', 'S'])
+            move = self.rng.randrange(3)
         
         self.last_move = move
-        return move
\ No newline at end of file
+        return move
+
+    def get_move_batch(self, n: int, opponent_moves=None) -> np.ndarray:
+        if n == 0:
+            return np.empty(0, dtype=np.int8)
+        rng = numpy_rng(self.rng)
+        repeat = rng.random(n) < self.rep_preference
+        if self.last_move is None:
+            repeat[0] = False
+
+        # Every round points at the latest fresh draw (index 0 = last_move)
+        fresh = np.empty(n + 1, dtype=np.int8)
+        fresh[0] = self.last_move if self.last_move is not None else 0
+        fresh[1:] = rng.integers(0, 3, n)
+        source = np.where(repeat, 0, np.arange(1, n + 1))
+        moves = fresh[np.maximum.accumulate(source)]
+
+        self.last_move = int(moves[-1])
+        return moves
\ No newline at end of file
@@ -1,16 +1,27 @@
 from .player import Player
-import random
+from predictors.rng import RngLike, numpy_rng
+import numpy as np
 
 class SlightBiasPlayer(Player):
     # player that has a slight bias towards Rock
 
-    def __init__(self):
-        super().__init__()
-        self.bias_move = 'R'
-        self.other_moves = ['P', 'S']
+    def __init__(self, rng: RngLike = None):
+        super().__init__(rng)
+        self.bias_move = 0  # R
+        self.other_moves = (1, 2)  # P, S
 
     def get_move(self) -> str:
-        if random.random() < 0.4:
+        return self.MOVES[self.get_move_idx()]
+
+    def get_move_idx(self) -> int:
+        if self.rng.random() < 0.4:
             return self.bias_move
         else:
-            return random.choice(self.other_moves)
\ No newline at end of file
+            return self.rng.choice(self.other_moves)
+
+    def get_move_batch(self, n: int, opponent_moves=None) -> np.ndarray:
+        rng = numpy_rng(self.rng)
+        others = np.asarray(self.other_moves, dtype=np.int8)
+        moves = others[rng.integers(0, len(others), n)]
+        moves[rng.random(n) < 0.4] = self.bias_move
+        return moves
\ No newline at end of file
@@ -1,11 +1,21 @@
+from .history import MoveHistory
+from .rng import make_rng, spawn_seeds, numpy_rng
 from .base_predictor import RPSPredictor
 from .random_predictor import RandomPredictor
 from .markov_predictor import MarkovPredictor
+from .dense_markov_predictor import DenseMarkovPredictor
+from .backoff_markov_predictor import BackoffMarkovPredictor
 from .qlearning_predictor import QLearningPredictor
 
 __all__ = [
+    "MoveHistory",
+    "make_rng",
+    "spawn_seeds",
+    "numpy_rng",
     "RPSPredictor",
     "RandomPredictor",
     "MarkovPredictor",
+    "DenseMarkovPredictor",
+    "BackoffMarkovPredictor",
     "QLearningPredictor",
 ]
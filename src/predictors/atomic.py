@@ -0,0 +1,30 @@
+import os
+import pickle
+
+'''
+Atomic pickles
+
+Checkpoints (simulation/checkpoint.py) and Q-learning training
+checkpoints are written to `path.tmp`, synced to disk and then renamed
+over `path`, so a run killed while saving keeps the previous file.
+Lives in predictors/ because simulation already depends on predictors,
+not the other way round.
+'''
+
+
+def save_pickle(path: str, state: dict) -> None:
+    os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_pickle(path: str) -> dict | None:
+    # None if there is nothing to resume from
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return pickle.load(f)
@@ -0,0 +1,90 @@
+import numpy as np
+from .base_predictor import RPSPredictor
+from .dense_markov_predictor import DenseMarkovPredictor
+from .rng import RngLike
+
+'''
+Backoff Markov Chain
+
+Orders 1..K at once. The rolling base-3 index of the last K moves
+already holds every shorter context in its low digits,
+
+    state of order k = state % 3^k
+
+so one index drives all K tables. They are stacked into one array (the
+order-k table starts at row offsets[k]) and all updated in the same
+pass. predict_idx backs off from order K to the longest order whose
+state has at least `min_count` observations, then to move frequency.
+
+Each round also scores what every order on its own would have
+predicted, so order_stats() gives K accuracies from a single run
+instead of K separate simulations.
+'''
+
+class BackoffMarkovPredictor(DenseMarkovPredictor):
+    '''
+    With order 3 after history [R, P, P, S]:
+      order 3: counts[offsets[3] + index(P, P, S)]   used if seen >= min_count times
+      order 2: counts[offsets[2] + index(P, S)]       otherwise
+      order 1: counts[offsets[1] + index(S)]          otherwise
+      frequency of R / P / S                          otherwise
+    '''
+
+    def __init__(self, order: int = 6, min_count: int = 2,
+                 history_size: int | None = RPSPredictor.HISTORY_SIZE, rng: RngLike = None):
+        if order < 1:
+            raise ValueError(f"order must be at least 1, got {order}.")
+        super().__init__(order, history_size, rng)
+        self.min_count = min_count
+        # 3^k states per order, order k at rows offsets[k]..offsets[k] + 3^k
+        self.sizes = [3 ** k for k in range(order + 1)]
+        self.offsets = [0] * (order + 1)
+        for k in range(2, order + 1):
+            self.offsets[k] = self.offsets[k - 1] + self.sizes[k - 1]
+        rows = self.offsets[order] + self.sizes[order]
+        self.counts = np.zeros((rows, 3), dtype=np.int64)
+        self.state_totals = np.zeros(rows, dtype=np.int64)
+        self.state_best = np.zeros(rows, dtype=np.int8)
+        # Per order: rounds it had a trusted prediction, and how many were right
+        self.order_predictions = [0] * (order + 1)
+        self.order_correct = [0] * (order + 1)
+        self._bind()
+
+    def _pattern_move(self) -> int | None:
+        totals, state = self._totals, self.state
+        for k in range(min(self.order, self.seen), 0, -1):
+            row = self.offsets[k] + state % self.sizes[k]
+            if totals[row] >= self.min_count:
+                return self._best[row]
+        return None
+
+    def _count_transition(self, player_move: int) -> None:
+        cells, totals, best_moves = self._cells, self._totals, self._best
+        state = self.state
+        for k in range(1, min(self.order, self.seen) + 1):
+            row = self.offsets[k] + state % self.sizes[k]
+            best = best_moves[row]
+            if totals[row] >= self.min_count:
+                self.order_predictions[k] += 1
+                self.order_correct[k] += best == player_move
+
+            cells[row * 3 + player_move] += 1
+            totals[row] += 1
+            # The argmax only moves to the counted move, ties go to the lowest code
+            count, top = cells[row * 3 + player_move], cells[row * 3 + best]
+            if count > top or (count == top and player_move < best):
+                best_moves[row] = player_move
+        self.state = (state * 3 + player_move) % self.num_states
+        self.seen += 1
+
+    def order_stats(self) -> list[dict]:
+        '''
+        How each order would have done on its own: rounds where its state
+        had at least min_count observations, and the share of those where
+        its most likely move was the player's actual move.
+        '''
+        return [{"order": k,
+                 "predictions": self.order_predictions[k],
+                 "correct": self.order_correct[k],
+                 "accuracy": self.order_correct[k] / self.order_predictions[k] if self.order_predictions[k] else 0.0}
+                for k in range(1, self.order + 1)]
@@ -1,18 +1,41 @@
 from abc import ABC, abstractmethod
+import numpy as np
+from .history import MoveHistory
+from .rng import RngLike, make_rng
 
 '''
 RPSPredictor class interface
 
+Moves are encoded as integers internally: R = 0, P = 1, S = 2.
+The move that beats m is (m + 1) % 3 and the result of a round from the
+AI's perspective is (ai - player) % 3 -> 0 tie, 1 win, 2 lose.
+Strings are only used at the I/O edges (predict/update/get_result).
+
 class vars:
-    MOVES: list[str] 
-        - All possible moves (R,P,S)
+    MOVES: tuple[str, str, str]
+        - All possible moves (R,P,S), indexed by their integer code
+
+    MOVE_TO_IDX: dict[str, int]
+        - Integer code for each move string
 
-    COUNTERS: dict[str, str] 
+    COUNTERS: dict[str, str]
         - The Counter for each move (The winning move)
 
+    RESULTS: tuple[str, str, str]
+        - Result strings indexed by the integer result code
+
+    TIE, WIN, LOSE: int
+        - The integer result codes (0, 1, 2)
+
+    HISTORY_SIZE: int
+        - Default number of past player moves kept in history
+
 instance vars:
-    history: list[str] 
-        - List of Player's past moves in order
+    history: MoveHistory
+        - Ring buffer of the Player's last `history_size` moves in order (integer codes)
+        - history_size=None keeps the full log instead
+    rng: random.Random
+        - The predictor's own random stream, built from the `rng` seed argument (see rng.py)
     wins: int
         - Num of rounds AI won
     losses: int
@@ -21,19 +44,27 @@ instance vars:
         - Num of rounds that ended in a tie
 
 abstract methods:
-    predict() -> str
+    predict_idx() -> int
         - Use the strategy to predict the player's next move, then return the AI move that beats it.
             1. predicted_move = Predict player's next move through strategy (implemented differently depending on strategy)
-            2. ai_move = counter(predicted_move)
+            2. ai_move = counter_idx(predicted_move)
             3. return ai_move
 
-    update(player_move: str, ai_move: str) -> None
+    update_idx(player_move: int, ai_move: int) -> None
         - Update the predictor after a round.
         1. Add player's move to history
         2. Update scoreboard statistics
         3. Update the strategy (learn)
 
+optional methods:
+    predict_batch(n: int) -> np.ndarray / update_batch(player_moves, ai_moves) -> None
+        - Only for predictors that never look at the player's moves (RandomPredictor).
+          Lets simulation/vectorized.py generate a whole run as arrays
+
 concrete methods:
+    predict() -> str / update(player_move: str, ai_move: str) -> None
+        - String wrappers around predict_idx / update_idx
+
     counter(move: str) -> str
         - Returns the move that beats the given move.
         If P, return S because scissors beats paper
@@ -42,6 +73,15 @@ concrete methods:
         - Returns who won the round from the AI's perspective
             - 'win', 'lose', or 'tie'
 
+    counter_idx(move: int) -> int / result_idx(player: int, ai: int) -> int
+        - Integer versions of counter and get_result
+
+    encode_batch(moves) -> np.ndarray / decode_batch(codes) -> np.ndarray
+    counter_batch(moves) -> np.ndarray
+    get_results_batch(player_moves, ai_moves) -> np.ndarray
+        - Array versions of the above (class methods), for rescoring whole logs.
+          Accept integer codes or 'R'/'P'/'S' strings, return int8 codes
+
     get_stats() -> dict
         - Returns current metrics
             dict: {wins: , losses:, ties:, total_games:, win_rate:,}
@@ -51,61 +91,145 @@ concrete methods:
         - Clears history and all statistics
 '''
 
+# ASCII code -> move code lookup for encode_batch ('R' -> 0, 'P' -> 1, 'S' -> 2)
+_CHAR_TO_IDX = np.full(128, -1, dtype=np.int8)
+_CHAR_TO_IDX[[ord('R'), ord('P'), ord('S')]] = [0, 1, 2]
+
 class RPSPredictor(ABC):
     MOVES: tuple[str, str, str] = ('R', 'P', 'S')
+    MOVE_TO_IDX = {'R': 0, 'P': 1, 'S': 2}
     COUNTERS = {'R':'P', 'P':'S', 'S':'R'}
+    RESULTS: tuple[str, str, str] = ('tie', 'win', 'lose')
 
-    def __init__(self):
-        self.history = []
+    # Integer result codes, see result_idx
+    TIE, WIN, LOSE = 0, 1, 2
+
+    HISTORY_SIZE = 64
+
+    def __init__(self, history_size: int | None = HISTORY_SIZE, rng: RngLike = None):
+        self.history = MoveHistory(maxlen=history_size)
+        self.rng = make_rng(rng)
         self.wins = 0
         self.losses = 0
         self.ties = 0
 
     @abstractmethod
-    def predict(self) -> str:
+    def predict_idx(self) -> int:
         '''
         Use the strategy to model the player's next move,
-        then return the AI move that beats it.
+        then return the (integer) AI move that beats it.
         '''
         pass
 
     @abstractmethod
-    def update(self, player_move: str, ai_move: str) -> None:
+    def update_idx(self, player_move: int, ai_move: int) -> None:
         '''
-        Update the predictor after a round.
+        Update the predictor after a round (integer moves).
         1. Add player's move to history
         2. Update scoreboard statistics
         3. Update the strategy (learn)
         '''
         pass
 
+    # --- string wrappers (I/O edge) ---
+
+    def predict(self) -> str:
+        return self.MOVES[self.predict_idx()]
+
+    def update(self, player_move: str, ai_move: str) -> None:
+        self.update_idx(self.encode(player_move), self.encode(ai_move))
+
     # --- concrete methods ---
-    
+
+    # Converts a move string to its integer code
+    @classmethod
+    def encode(cls, move: str) -> int:
+        try:
+            return cls.MOVE_TO_IDX[move]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid move: {move}. Expected one of {cls.MOVES}.") from None
+
+    # Converts an integer code back to its move string
+    @classmethod
+    def decode(cls, move: int) -> str:
+        return cls.MOVES[move]
+
+    # Integer counter: the move that beats `move`
+    @staticmethod
+    def counter_idx(move: int) -> int:
+        return (move + 1) % 3
+
+    # Integer result from the AI's perspective: 0 tie, 1 win, 2 lose
+    @staticmethod
+    def result_idx(player_move: int, ai_move: int) -> int:
+        return (ai_move - player_move) % 3
+
+    # --- batch (array) versions ---
+
+    # Converts an array of move strings (or codes) to int8 codes
+    @classmethod
+    def encode_batch(cls, moves) -> np.ndarray:
+        # Categorical columns (columnar results files) already hold the codes
+        categories = getattr(getattr(moves, "cat", None), "categories", None)
+        if categories is not None and tuple(categories) == cls.MOVES:
+            codes = moves.cat.codes.to_numpy(np.int8)
+            if (codes < 0).any():
+                raise ValueError(f"Invalid moves in batch. Expected one of {cls.MOVES}.")
+            return codes
+
+        arr = np.asarray(moves)
+        if arr.dtype.kind in 'iub':
+            # Checked before the int8 cast, which would wrap e.g. 258 to 2
+            if arr.size and (arr.min() < 0 or arr.max() > 2):
+                raise ValueError(f"Invalid moves in batch. Expected one of {cls.MOVES}.")
+            return arr.astype(np.int8, copy=False)
+
+        arr = arr.astype(str)
+        # Single characters are 4 bytes in numpy's UCS4 strings, anything
+        # longer (or NaN -> 'nan') cannot be a move
+        if arr.size and arr.dtype.itemsize != 4:
+            raise ValueError(f"Invalid moves in batch. Expected one of {cls.MOVES}.")
+        codes = _CHAR_TO_IDX[np.minimum(arr.view(np.uint32), 127)]
+        if (codes < 0).any():
+            raise ValueError(f"Invalid moves in batch. Expected one of {cls.MOVES}.")
+        return codes
+
+    # Converts an array of codes back to strings (moves by default)
+    @classmethod
+    def decode_batch(cls, codes, labels=None) -> np.ndarray:
+        labels = np.asarray(cls.MOVES if labels is None else labels, dtype=object)
+        return labels[np.asarray(codes)]
+
+    # Counter of every move in the array
+    @classmethod
+    def counter_batch(cls, moves) -> np.ndarray:
+        return (cls.encode_batch(moves) + 1) % 3
+
+    # Result codes (0 tie, 1 win, 2 lose) of every round from the AI's perspective
+    @classmethod
+    def get_results_batch(cls, player_moves, ai_moves) -> np.ndarray:
+        return (cls.encode_batch(ai_moves) - cls.encode_batch(player_moves)) % 3
+
     # Returns the move that beats the input (check doc above)
     def counter(self, move: str) -> str:
         if move not in self.COUNTERS:
             raise ValueError(f"Invalid move: {move}. Expected one of {self.MOVES}.")
-        
+
         return self.COUNTERS[move]
-    
+
     # Returns result of the match
     def get_result(self, player_move: str, ai_move: str) -> str:
-        if player_move not in self.MOVES or ai_move not in self.MOVES:
+        if player_move not in self.MOVE_TO_IDX or ai_move not in self.MOVE_TO_IDX:
             raise ValueError("Moves must be one of 'R','P','S'.")
-        
-        if player_move == ai_move:
-            return 'tie'
-        
-        # player's move is 'P', AI's move is 'S' ... COUNTERS['P'] = 'S'
-        if self.COUNTERS[player_move] == ai_move:
-            return 'win'
-        return 'lose'
-    
+
+        # player's move is 'P' (1), AI's move is 'S' (2) ... (2 - 1) % 3 = 1 -> win
+        return self.RESULTS[(self.MOVE_TO_IDX[ai_move] - self.MOVE_TO_IDX[player_move]) % 3]
+
     # Return metrics of the matches (check doc for specifics)
     def get_stats(self) -> dict[str, float | int]:
         total = self.wins + self.losses + self.ties
         decisive_games = self.wins + self.losses
-        
+
         # Win rate should be on actual wins vs losses not total games
         if decisive_games > 0:
             ai_win_rate = self.wins / decisive_games
@@ -121,10 +245,10 @@ class RPSPredictor(ABC):
             'total_games': total,
             'ai_win_rate': ai_win_rate,
             'ai_win_rate_percent': f"{ai_win_rate * 100:.1f}%",
-            'player_win_rate': player_win_rate,  
-            'player_win_rate_percent': f"{player_win_rate * 100:.1f}%" 
+            'player_win_rate': player_win_rate,
+            'player_win_rate_percent': f"{player_win_rate * 100:.1f}%"
         }
-    
+
     # Clears history and resets scoreboard
     def reset(self) -> None:
         self.history.clear()
@@ -134,22 +258,29 @@ class RPSPredictor(ABC):
 
     # --- helpers ---
 
-    # Increment win/loss/tie counter based on result
-    def _bump_score(self, result: str) -> None:
-        if result == 'win':
+    # Batch version of _record_round for vectorized simulations
+    def _record_batch(self, player_moves: np.ndarray, ai_moves: np.ndarray) -> None:
+        self.history.extend(player_moves)
+        ties, wins, losses = np.bincount((ai_moves - player_moves) % 3, minlength=3)
+        self.wins += int(wins)
+        self.losses += int(losses)
+        self.ties += int(ties)
+
+    # Increment win/loss/tie counter based on integer result code
+    def _bump_score(self, result: int) -> None:
+        if result == 1:
             self.wins += 1
-        elif result == 'lose':
+        elif result == 2:
             self.losses += 1
         else:
             self.ties += 1
 
-    # Appends history and updates scoreboard, helper for update 
-    def _record_round(self, player_move: str, ai_move: str) -> None:
+    # Appends history and updates scoreboard, helper for update_idx
+    def _record_round(self, player_move: int, ai_move: int) -> None:
         self.history.append(player_move)
-        result = self.get_result(player_move, ai_move)
-        self._bump_score(result)
+        self._bump_score((ai_move - player_move) % 3)
 
     # Returns a readable string representation of the predictor showing W-L-T
     def __repr__(self) -> str:
         stats = self.get_stats()
-        return f"{self.__class__.__name__}(games={stats['total_games']}, W-L-T={self.wins}-{self.losses}-{self.ties})"
\ No newline at end of file
+        return f"{self.__class__.__name__}(games={stats['total_games']}, W-L-T={self.wins}-{self.losses}-{self.ties})"
@@ -0,0 +1,95 @@
+import numpy as np
+from .base_predictor import RPSPredictor
+from .markov_predictor import MarkovPredictor
+from .rng import RngLike
+
+'''
+Dense Markov Chain
+
+MarkovPredictor with the transition counts in a (3^order, 3) NumPy
+array instead of nested dicts. The last `order` player moves are kept
+as one base-3 number that is rolled forward every round,
+
+    state = (state * 3 + move) % 3^order
+
+so predict and update are a few array reads/writes, with no tuple
+slicing or hashing, whatever the order. Like MarkovPredictor, the
+per-state total and most likely next move are kept up to date in
+update_idx, so predict_idx reads two cells. Worth it from order ~5 up;
+the counts take 3^order * 3 * 8 bytes (17 KB at order 6, 157 KB at
+order 8, 4.25 MB at order 11).
+'''
+
+class DenseMarkovPredictor(MarkovPredictor):
+    '''
+    Same strategy as MarkovPredictor:
+    counts[state] = [R, P, S] counts of the player's move after `state`
+
+    With order 2, history = [R, P, P, P] (R=0, P=1, S=2)
+    state = index of (P, P) = 1*3 + 1 = 4
+    counts[4] = [2, 15, 3]: predict P, play S
+
+    One difference: when two moves share the top count, the lowest code
+    (R, then P, then S) is predicted, MarkovPredictor takes the one it
+    saw first.
+    '''
+
+    MAX_ORDER = 12  # 3^12 * 3 int64 counts = 12.8 MB
+
+    def __init__(self, order: int = 3, history_size: int | None = RPSPredictor.HISTORY_SIZE,
+                 rng: RngLike = None):
+        if not 0 <= order <= self.MAX_ORDER:
+            raise ValueError(f"order must be between 0 and {self.MAX_ORDER}, got {order}.")
+        super().__init__(order, history_size, rng)
+        self.transitions = None  # the dense table replaces the dicts
+        self.num_states = 3 ** order
+        self.counts = np.zeros((self.num_states, 3), dtype=np.int64)
+        self.state_totals = np.zeros(self.num_states, dtype=np.int64)
+        self.state_best = np.zeros(self.num_states, dtype=np.int8)
+        # Base-3 index of the last `order` player moves, valid once `order` were seen
+        self.state = 0
+        self.seen = 0
+        self._bind()
+
+    def _bind(self) -> None:
+        # Flat view for scalar access: indexing a memoryview is ~2x faster than numpy scalars
+        self._cells = memoryview(self.counts.reshape(-1))
+        self._totals = memoryview(self.state_totals)
+        self._best = memoryview(self.state_best)
+
+    def _pattern_move(self) -> int | None:
+        # Need atleast 2 observations to trust the pattern
+        if self.seen < self.order or self._totals[self.state] < 2:
+            return None
+        return self._best[self.state]
+
+    def _count_transition(self, player_move: int) -> None:
+        if self.seen >= self.order:
+            state, cells = self.state, self._cells
+            cells[state * 3 + player_move] += 1
+            self._totals[state] += 1
+
+            # The argmax only moves to the counted move, ties go to the lowest code
+            best = self._best[state]
+            count, top = cells[state * 3 + player_move], cells[state * 3 + best]
+            if count > top or (count == top and player_move < best):
+                self._best[state] = player_move
+        self.state = (self.state * 3 + player_move) % self.num_states
+        self.seen += 1
+
+    def reset(self) -> None:
+        super().reset()
+        # The counts are kept (like MarkovPredictor's transitions), the state restarts
+        self.state = 0
+        self.seen = 0
+
+    # memoryviews can't be pickled (checkpoints, worker processes)
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        for view in ("_cells", "_totals", "_best"):
+            del state[view]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._bind()
@@ -0,0 +1,120 @@
+from array import array
+import numpy as np
+
+'''
+Move History
+
+Compact, array-backed history of integer moves (R=0, P=1, S=2).
+'''
+
+class MoveHistory:
+    '''
+    Ring buffer of the last `maxlen` moves, one byte per move.
+
+    With maxlen=None it keeps the full log instead (the array just grows).
+    Indexing, iteration and len() only cover the moves that are still
+    retained (oldest first); `total` counts every move ever appended.
+
+    The ring is stored twice back to back ([a b c | a b c]) so the last k
+    moves are always one contiguous slice, no wrap-around handling needed.
+
+    history = MoveHistory(maxlen=3)
+    for m in [0, 1, 1, 2]: history.append(m)
+    history.last(3) -> (1, 1, 2)
+    '''
+
+    def __init__(self, maxlen: int | None = None, typecode: str = 'b'):
+        if maxlen is not None and maxlen < 1:
+            raise ValueError(f"maxlen must be at least 1, got {maxlen}.")
+        self.maxlen = maxlen
+        self.typecode = typecode
+        self.total = 0  # moves appended since creation / clear()
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        if self.maxlen is None:
+            self._buf = array(self.typecode)
+        else:
+            self._buf = array(self.typecode, [0]) * (2 * self.maxlen)
+        # next ring slot, end of the retained window in _buf (exclusive)
+        # and number of retained moves
+        self._pos = 0
+        self._end = 0
+        self._size = 0
+
+    @property
+    def full_log(self) -> bool:
+        return self.maxlen is None
+
+    def append(self, move: int) -> None:
+        self.total += 1
+        if self.maxlen is None:
+            self._buf.append(move)
+            self._end += 1
+            self._size += 1
+            return
+
+        # Write into both halves; once the ring has filled up the window
+        # [_end - maxlen, _end) starts right after the slot just written
+        pos = self._pos
+        self._buf[pos] = move
+        self._buf[pos + self.maxlen] = move
+        pos += 1
+        if self._size < self.maxlen:
+            self._size += 1
+        self._end = pos + self.maxlen if self._size == self.maxlen else pos
+        self._pos = 0 if pos == self.maxlen else pos
+
+    def extend(self, moves) -> None:
+        if isinstance(moves, np.ndarray):
+            if self.maxlen is None:
+                self._buf.frombytes(moves.astype(self.typecode).tobytes())
+                self.total += len(moves)
+                self._end += len(moves)
+                self._size += len(moves)
+                return
+            # Only the tail can still be retained by the ring
+            skipped = max(0, len(moves) - self.maxlen)
+            self.total += skipped
+            moves = moves[skipped:].tolist()
+
+        for move in moves:
+            self.append(move)
+
+    # Returns the last k moves (oldest first) as a tuple of ints
+    def last(self, k: int) -> tuple[int, ...]:
+        if k > self._size:
+            k = self._size
+        end = self._end
+        return tuple(self._buf[end - k:end]) if k > 0 else ()
+
+    # Returns the retained moves (oldest first) as a NumPy array
+    def to_array(self) -> np.ndarray:
+        return np.frombuffer(self._buf, dtype=self.typecode)[self._end - self._size:self._end].copy()
+
+    def to_list(self) -> list[int]:
+        return self._buf[self._end - self._size:self._end].tolist()
+
+    def clear(self) -> None:
+        self.total = 0
+        self._reset_buffer()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+
+        n = self._size
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("history index out of range")
+        return self._buf[self._end - n + index]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxlen={self.maxlen}, moves={self.to_list()})"
@@ -1,12 +1,28 @@
 import random
 from .base_predictor import RPSPredictor
+from .rng import RngLike
 from collections import defaultdict
+from functools import partial
 
 '''
 Higher Order Markov Chain
 
 Pattern detection using transition probabilities.
 Tracks sequences/history of moves to predict the next.
+
+With a half_life the counts decay: an observation made half_life rounds
+ago weighs half as much as the latest one, so the chain keeps up with
+opponents that change strategy. Decay is applied lazily: every state
+remembers the round it was last counted in, and its counts are scaled
+by decay ** (rounds since) the next time it is touched. Scaling all
+counts of a state by one factor never changes which move is most
+likely, so predict_idx stays a lookup and updates stay O(1).
+
+With a window only the last `window` transitions are counted: a ring
+buffer holds their (state, next move) pairs, and each new transition
+takes the slot of the oldest one, whose count is taken back. States
+whose counts drop to zero are dropped, so memory is bounded by the
+window and the table is exactly the last `window` transitions.
 '''
 
 class MarkovPredictor(RPSPredictor):
@@ -24,44 +40,146 @@ class MarkovPredictor(RPSPredictor):
     '''
 
     # Check documentation before implementing
-    def __init__(self, order: int = 3):
-        super().__init__()
+    # history_size is raised to at least order + 1, None keeps the full log
+    # half_life: rounds after which a count weighs half (None: counts never decay)
+    # window: count only the last `window` transitions (None: all of them)
+    def __init__(self, order: int = 3, history_size: int | None = RPSPredictor.HISTORY_SIZE,
+                 rng: RngLike = None, half_life: float | None = None, window: int | None = None):
+        super().__init__(None if history_size is None else max(history_size, order + 1), rng)
+        if half_life is not None and half_life <= 0:
+            raise ValueError(f"half_life must be positive, got {half_life}.")
+        if window is not None and window < 1:
+            raise ValueError(f"window must be at least 1, got {window}.")
+        if half_life is not None and window is not None:
+            raise ValueError("Use either half_life or window, not both.")
         self.order = order
-        self.transitions = defaultdict(lambda: defaultdict(int))
-        self.frequency = {'R': 0, 'P': 0, 'S': 0}
-
-    def predict(self) -> str:
+        self.half_life = half_life
+        # Per-round weight factor, and the round each state was last counted in
+        self.decay = None if half_life is None else 0.5 ** (1 / half_life)
+        self.clock = 0
+        self.state_touched = {}
+        # Ring buffer of the counted (state, next move) pairs, oldest at window_pos once full
+        self.window = window
+        self.window_entries = [] if window is not None else None
+        self.window_pos = 0
+        self.transitions = defaultdict(partial(defaultdict, int))  # picklable, unlike a lambda
+        # Kept up to date in update_idx so predict_idx is a lookup:
+        # per state the number of transitions seen and the most likely next move
+        self.state_totals = {}
+        self.state_best = {}
+        # Last `order` player moves, None until that many were seen
+        self.current_state = None
+        # Player move counts indexed by move code (R, P, S), their sum and argmax
+        # (frequency_total counts observations, it does not decay; the
+        # frequencies are not windowed)
+        self.frequency = [0, 0, 0]
+        self.frequency_total = 0
+        self.frequent_move = 0
+
+    def predict_idx(self) -> int:
         # Tries the pattern matching
-        if len(self.history) >= self.order:
-            state = tuple(self.history[-self.order:])
-
-            # Checks if we've seen this pattern before
-            if state in self.transitions:
-                counts = self.transitions[state]
-
-                # Need atleast 2 observations to trust the pattern
-                if sum(counts.values()) >= 2:
-                    predicted_player_move = max(counts, key = counts.get)
-                    return self.counter(predicted_player_move)
+        predicted_player_move = self._pattern_move()
+        if predicted_player_move is not None:
+            return self.counter_idx(predicted_player_move)
                 
         # Fall back onto frequency analysis
-        if sum(self.frequency.values()) >- 5:
-            predicted_player_move = max(self.frequency, key = self.frequency.get)
-            return self.counter(predicted_player_move)
+        if self.frequency_total >- 5:
+            return self.counter_idx(self.frequent_move)
         
         # If not enough data: go random
-        predicted_player_move = random.choice(self.MOVES)
-        return self.counter(predicted_player_move)
+        predicted_player_move = self.rng.randrange(3)
+        return self.counter_idx(predicted_player_move)
 
-    def update(self, player_move: str, ai_move: str) -> None:
+    def update_idx(self, player_move: int, ai_move: int) -> None:
         self._record_round(player_move, ai_move)
-        self.frequency[player_move] += 1
-
-        if len(self.history) >= self.order + 1:
-            state = tuple(self.history[-(self.order+1):-1])
-            next_move = self.history[-1]
-
-            self.transitions[state][next_move] += 1
+        self._count_frequency(player_move)
+        self._count_transition(player_move)
+
+    def reset(self) -> None:
+        super().reset()
+        # The learned counts stay, the history they index into is gone
+        self.current_state = None
+
+    def _count_frequency(self, player_move: int) -> None:
+        frequency = self.frequency
+        self.clock += 1
+        if self.decay is not None:
+            # Touched every round, so decayed right away
+            for move in range(3):
+                frequency[move] *= self.decay
+        frequency[player_move] += 1
+        self.frequency_total += 1
+        # max() over R, P, S keeps the lowest code among equal counts
+        top = self.frequent_move
+        if frequency[player_move] > frequency[top] or (frequency[player_move] == frequency[top] and player_move < top):
+            self.frequent_move = player_move
+
+    # Most likely next player move after the current state, None if the pattern isn't trusted yet
+    def _pattern_move(self) -> int | None:
+        state = self.current_state
+
+        # Need atleast 2 observations of this pattern to trust it
+        if state is not None and self.state_totals.get(state, 0) >= 2:
+            return self.state_best[state]
+        return None
+
+    # Counts the transition ending in player_move (already appended to history)
+    def _count_transition(self, player_move: int) -> None:
+        seen = len(self.history)
+        if seen >= self.order + 1:
+            window = self.history.last(self.order + 1)
+            state = window[:-1]
+            next_move = window[-1]
+
+            counts = self.transitions[state]
+            if self.decay is not None:
+                self._decay_state(state, counts)
+            counts[next_move] += 1
+            self.state_totals[state] = self.state_totals.get(state, 0) + 1
+
+            # Same answer as max(counts, key=counts.get): the highest count,
+            # the first move seen among equal ones
+            best = self.state_best.get(state)
+            count = counts[next_move]
+            if best is None or count > counts[best]:
+                self.state_best[state] = next_move
+            elif count == counts[best] and next_move != best:
+                self.state_best[state] = next(move for move in counts if move == next_move or move == best)
+
+            if self.window is not None:
+                self._slide_window(state, next_move)
+
+            self.current_state = window[1:]
+        elif seen == self.order:
+            self.current_state = self.history.last(self.order)
+
+    # Stores the new transition, taking back the count of the one that leaves the window
+    def _slide_window(self, state: tuple, next_move: int) -> None:
+        entries = self.window_entries
+        if len(entries) < self.window:
+            entries.append((state, next_move))
+            return
+        old_state, old_move = entries[self.window_pos]
+        entries[self.window_pos] = (state, next_move)
+        self.window_pos = (self.window_pos + 1) % self.window
+
+        counts = self.transitions[old_state]
+        counts[old_move] -= 1
+        self.state_totals[old_state] -= 1
+        if self.state_totals[old_state] == 0:
+            del self.transitions[old_state], self.state_totals[old_state], self.state_best[old_state]
+        elif old_move == self.state_best[old_state]:
+            # Only a drop of the top count can change the argmax
+            self.state_best[old_state] = max(counts, key = counts.get)
+
+    # Brings a state's counts to the current round before it is counted in
+    def _decay_state(self, state: tuple, counts: dict) -> None:
+        last = self.state_touched.get(state)
+        if last is not None and last != self.clock:
+            factor = self.decay ** (self.clock - last)
+            for move in counts:
+                counts[move] *= factor
+        self.state_touched[state] = self.clock
 
 if __name__ == "__main__":
     print("MARKOV TESTING")
@@ -2,40 +2,47 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-import random
 import pickle
 import glob
 import numpy as np
-from typing import Dict, Optional, Tuple, Literal
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Literal
 from .base_predictor import RPSPredictor
-from players.player import Player
+from .history import MoveHistory
+from .rng import RngLike
+from .atomic import save_pickle, load_pickle
+if TYPE_CHECKING:
+    # players.player imports predictors.rng, only needed for the annotation
+    from players.player import Player
 
 
 
 class QLearningPredictor(RPSPredictor):
-    MOVE_TO_IDX = {'R': 0, 'P': 1, 'S': 2}
-    IDX_TO_MOVE = {0: 'R', 1: 'P', 2: 'S'}
+    # reward for each integer result code (tie, win, lose)
+    REWARDS = (0, +1, -1)
     trained = False
 
     def __init__(self, alpha: float = None,
                  gamma: float = 0.9,
                  epsilon: float = 1.0,
                  decay_rate: float = 0.99,
-                 verbose: bool = True):
-        super().__init__()
+                 verbose: bool = True,
+                 history_size: int | None = RPSPredictor.HISTORY_SIZE,
+                 rng: RngLike = None):
+        super().__init__(history_size, rng)
 
         self.gamma = gamma
         self.epsilon = epsilon
         self.decay_rate = decay_rate
         self.verbose = verbose
 
-        # q table: state (tuple of last 3 rounds) -> array of Q-values for each predicted move
+        # q table: state (tuple of last 3 round codes) -> array of Q-values for each predicted move
         self.q_table: Dict[Optional[Tuple], np.ndarray] = {}
 
         # track number of updates for adaptive learning rate
         self.n_updates: Dict[Optional[Tuple], np.ndarray] = {}
 
-        self.game_history = []  # list of (opponent_move, ai_move) tuples
+        # last rounds as opponent_move * 3 + ai_move codes, only 3 are needed for the state
+        self.game_history = MoveHistory(None if history_size is None else max(history_size, 3))
 
         self.prev_state = None
         self.prev_action_idx = None
@@ -46,17 +53,14 @@ class QLearningPredictor(RPSPredictor):
         if q_table_path:
             self.load_q_table(q_table_path)
 
-    def _get_state(self) -> Tuple[Tuple[str, str], ...]:
+    def _get_state(self) -> Tuple[int, ...]:
         """
         Get current state from last 3 rounds of play.
-        Returns tuple of last 3 (opponent_move, ai_move) pairs, or None if < 3 rounds.
+        Returns tuple of the last (up to) 3 opponent_move * 3 + ai_move codes.
         """
-        if len(self.game_history) == 0:
-            return tuple()
+        return self.game_history.last(3)
 
-        return tuple(self.game_history[-3:])
-
-    def predict(self) -> str:
+    def predict_idx(self) -> int:
         """
         Predict opponent's next move and return the counter.
         Uses epsilon-greedy selection.
@@ -68,13 +72,16 @@ class QLearningPredictor(RPSPredictor):
             self.q_table[state] = np.zeros(3)
             self.n_updates[state] = np.zeros(3)
 
-        action_idx = np.argmax(self.q_table[state]) \
-             if random.random() >= self.epsilon \
-             else random.randint(0, 2)
-
-        raw_ai_move = self.IDX_TO_MOVE[action_idx]
+        if self.rng.random() >= self.epsilon:
+            # Ties are broken at random: with argmax two greedy copies that
+            # start from all-zero Q-values lock into the same move forever
+            q_values = self.q_table[state]
+            best = np.flatnonzero(q_values == q_values.max())
+            action_idx = int(best[0]) if len(best) == 1 else int(best[self.rng.randrange(len(best))])
+        else:
+            action_idx = self.rng.randint(0, 2)
 
-        ai_move = self.counter(raw_ai_move)
+        ai_move = self.counter_idx(action_idx)
 
         self.prev_state = state
         self.prev_action_idx = action_idx
@@ -82,22 +89,17 @@ class QLearningPredictor(RPSPredictor):
 
         return ai_move
 
-    def update(self, opponent_move: str, ai_move: str):
+    def update_idx(self, opponent_move: int, ai_move: int):
         """
         Update Q-table after observing opponent's actual move.
         Uses adaptive learning rate: eta = 1/(1 + N(s,a))
         """
-        self.game_history.append((opponent_move, ai_move))
+        self.game_history.append(opponent_move * 3 + ai_move)
 
         if self.prev_action_idx is None:
             return
 
-        result = self.get_result(opponent_move, ai_move)
-        reward = {
-            "win": +1,
-            "tie": 0,
-            "lose": -1
-        }[result]
+        reward = self.REWARDS[(ai_move - opponent_move) % 3]
 
 
         new_state = self._get_state()
@@ -122,53 +124,79 @@ class QLearningPredictor(RPSPredictor):
 
         self.epsilon *= self.decay_rate
 
-    def train_against(self, opponent: Player, episodes: int):
+    def train_against(self, opponent: 'Player', episodes: int,
+                      checkpoint: str | None = None,
+                      checkpoint_every: int = 1000,
+                      resume: bool = False):
         """
         Train the Q-learner by playing against an opponent.
+        checkpoint: file saved every checkpoint_every episodes with the
+        learner, the opponent, the episode offset and the stats so far.
+        resume=True continues from it (in place, on self and opponent)
+        and returns the stats of the whole training run.
         """
         if self.trained:
             return []
 
+        state = load_pickle(checkpoint) if checkpoint and resume else None
+        if state is None:
+            start = 0
+            wins = 0
+            losses = 0
+            ties = 0
+            training_stats = []
+        else:
+            self.__dict__.update(state["predictor"].__dict__)
+            opponent.__dict__.update(state["opponent"].__dict__)
+            start = state["episode"]
+            wins, losses, ties = state["totals"]
+            training_stats = state["training_stats"]
+
         if self.verbose:
-            print(f"[TRAIN] Training for {episodes} episodes...")
+            print(f"[TRAIN] Training for {episodes} episodes" + (f" (resuming at {start})..." if start else "..."))
             print(f"[TRAIN] Initial epsilon: {self.epsilon:.4f}")
 
-        wins = 0
-        losses = 0
-        ties = 0
-
-        training_stats = []
+        for ep in range(start, episodes):
+            if checkpoint and ep > start and ep % checkpoint_every == 0:
+                save_pickle(checkpoint, {
+                    "predictor": self,
+                    "opponent": opponent,
+                    "episode": ep,
+                    "totals": (wins, losses, ties),
+                    "training_stats": training_stats,
+                })
 
-        for ep in range(episodes):
-            ai_move = self.predict()
-            opp_move = opponent.get_move()
+            ai_move = self.predict_idx()
+            opp_move = opponent.get_move_idx()
 
             # track results
-            result = self.get_result(opp_move, ai_move)
-            if result == "win":
+            result = (ai_move - opp_move) % 3
+            if result == 1:
                 wins += 1
-            elif result == "lose":
+            elif result == 2:
                 losses += 1
             else:
                 ties += 1
 
             training_stats.append({
                 "round": ep + 1,
-                "model_move": ai_move,
-                "opponent_move": opp_move,
+                "model_move": self.MOVES[ai_move],
+                "opponent_move": self.MOVES[opp_move],
                 "model_prediction": None,
-                "result": result,
+                "result": self.RESULTS[result],
                 "cum_model_wins": wins,
                 "cum_player_wins": losses,
                 "cum_ties": ties
             })
 
-            opponent.observe(ai_move)
-            self.update(opp_move, ai_move)
+            opponent.observe_idx(ai_move)
+            self.update_idx(opp_move, ai_move)
 
         self.epsilon = 0.0
         self.trained = True
         self.save_q_table()
+        if checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
 
         return training_stats
 
@@ -220,8 +248,8 @@ class QLearningPredictor(RPSPredictor):
                 data = pickle.load(f)
 
             # convert lists back to numpy arrays
-            self.q_table = {k: np.array(v) for k, v in data["Q"].items()}
-            self.n_updates = {k: np.array(v) for k, v in data["N"].items()}
+            self.q_table = {self._encode_state(k): np.array(v) for k, v in data["Q"].items()}
+            self.n_updates = {self._encode_state(k): np.array(v) for k, v in data["N"].items()}
 
             self.episodes = data.get("episodes", 0)
             self.epsilon = 0.0
@@ -235,6 +263,17 @@ class QLearningPredictor(RPSPredictor):
         except Exception as e:
             print(f"Failed to load Q-table {path}: {e}")
 
+    def _encode_state(self, state: Tuple) -> Tuple[int, ...]:
+        # Older Q-tables use (opponent_move, ai_move) pairs, as strings or ints
+        def encode_round(r):
+            if isinstance(r, (int, np.integer)):
+                return int(r)
+            opp, ai = (m if isinstance(m, int) else self.MOVE_TO_IDX[m] for m in r)
+            return opp * 3 + ai
+        return tuple(encode_round(r) for r in state)
+
+
 if __name__ == "__main__":
     # Testing
-    pass
\ No newline at end of file
+    pass
+
@@ -1,5 +1,7 @@
 import random
+import numpy as np
 from .base_predictor import RPSPredictor
+from .rng import RngLike, numpy_rng
 
 ''' 
 Random Strategy
@@ -15,18 +17,25 @@ class RandomPredictor(RPSPredictor):
     Check documentation in 'base_predictor.py'
     '''
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, history_size: int | None = RPSPredictor.HISTORY_SIZE, rng: RngLike = None):
+        super().__init__(history_size, rng)
         
     # Randomly predicts the player's move and returns the counter    
-    def predict(self):
-        predicted_player_move = random.choice(self.MOVES)
-        return self.counter(predicted_player_move)
+    def predict_idx(self) -> int:
+        predicted_player_move = self.rng.randrange(3)
+        return self.counter_idx(predicted_player_move)
 
     # No need to track history, just update scoreboard
-    def update(self, player_move: str, ai_move: str) -> None:
+    def update_idx(self, player_move: int, ai_move: int) -> None:
         self._record_round(player_move, ai_move)
 
+    # The next n AI moves at once, the player's moves are never needed
+    def predict_batch(self, n: int) -> np.ndarray:
+        return self.counter_batch(numpy_rng(self.rng).integers(0, 3, n, dtype=np.int8))
+
+    def update_batch(self, player_moves: np.ndarray, ai_moves: np.ndarray) -> None:
+        self._record_batch(player_moves, ai_moves)
+
 
 if __name__ == "__main__":
     print("RANDOM TESTING")
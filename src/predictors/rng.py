@@ -0,0 +1,43 @@
+import random
+import numpy as np
+
+'''
+Per-agent random streams
+
+Every predictor and player owns its own random.Random instead of sharing
+the global `random` module, so a match is reproducible from its seed and
+parallel or sharded runs never touch shared state.
+
+random.Random is used for the per-round draws because it is ~20x faster
+per scalar draw than numpy.random.Generator; seeds still go through
+numpy's SeedSequence so child streams can be spawned independently, and
+vectorized code gets a numpy Generator derived from the same stream.
+'''
+
+RngLike = int | np.random.SeedSequence | random.Random | None
+
+
+def make_rng(seed: RngLike = None) -> random.Random:
+    '''
+    Returns a random.Random for `seed`:
+      - None: fresh OS entropy
+      - int or SeedSequence: deterministic stream
+      - random.Random: used as is (shared stream)
+    '''
+    if isinstance(seed, random.Random):
+        return seed
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return random.Random(int(seed.generate_state(1, np.uint64)[0]))
+
+
+def spawn_seeds(seed: int | np.random.SeedSequence | None, n: int) -> list[np.random.SeedSequence]:
+    # n independent child seeds, e.g. one per agent of a match or one per shard
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
+
+
+def numpy_rng(rng: random.Random) -> np.random.Generator:
+    # numpy Generator for batch draws, seeded from (and advancing) rng
+    return np.random.default_rng(rng.getrandbits(128))
@@ -0,0 +1,35 @@
+from simulation.league import League, entrants
+from simulation.tournament import PREDICTORS, PLAYERS
+
+import argparse
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate every predictor and player against each other (Elo).")
+    parser.add_argument("--predictors", nargs="+", choices=list(PREDICTORS), default=list(PREDICTORS),
+                        help="Predictors to enter (default: all)")
+    parser.add_argument("--players", nargs="+", choices=list(PLAYERS), default=list(PLAYERS),
+                        help="Players to enter (default: all)")
+    parser.add_argument("--mode", choices=["round-robin", "swiss"], default="round-robin")
+    parser.add_argument("--swiss-rounds", type=int, default=5, help="Rounds of Swiss pairings")
+    parser.add_argument("--games", type=int, default=20000, help="Rounds per match")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=None, help="Root seed, each match gets a child seed")
+    parser.add_argument("--output", default=None, help="Save the leaderboard to this CSV")
+    parser.add_argument("--matches", default=None, help="Save every match result to this CSV")
+    args = parser.parse_args()
+
+    league = League(entrants(args.predictors, args.players),
+                    num_games=args.games, workers=args.workers, seed=args.seed)
+    if args.mode == "swiss":
+        board = league.swiss(args.swiss_rounds)
+    else:
+        board = league.round_robin()
+
+    print(board.to_string(index=False))
+    if args.output:
+        board.to_csv(args.output, index=False)
+    if args.matches:
+        league.matches().to_csv(args.matches, index=False)
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,17 @@
 import random
-import pandas as pd
 from players.random_player import RandomPlayer
 from predictors.random_predictor import RandomPredictor
 from game import RPSGame
 from players.model_agent import ModelAgent
+from simulation.recorder import RoundRecorder
 
 def simulate_games(player_class, predictor_class, num_games=100000):
     player = player_class()
     predictor = predictor_class()
     game = RPSGame(player, predictor)
 
-    results = {
-        'player_wins': 0,
-        'predictor_wins': 0,
-        'ties': 0
-    }
-
-    for _ in range(num_games):
-        result = game.play()
-        if result == 'player':
-            results['player_wins'] += 1
-        elif result == 'predictor':
-            results['predictor_wins'] += 1
-        else:
-            results['ties'] += 1
-
+    results = game.play_batch(num_games, keep_records=False)
+    del results['records']
     return results
 
 def simulate_model_vs_player(model, player, num_games=100000, deterministic=False, to_csv: str = None):
@@ -35,56 +22,30 @@ def simulate_model_vs_player(model, player, num_games=100000, deterministic=Fals
 
     agent = ModelAgent(model, deterministic=deterministic)
 
-    def round_result(my, opp):
-        if my == opp:
-            return 'tie'
-        beats = {'R': 'S', 'P': 'R', 'S': 'P'}
-        return 'win' if beats.get(my) == opp else 'loss'
-    
-    def reverse_counter(ai_move):
-        reverse = {'R': 'S', 'P': 'R', 'S': 'P'}
-        return reverse.get(ai_move)
+    # Integer codes in the loop: R=0, P=1, S=2 and (my - opp) % 3 -> tie/win/loss
+    MOVES = ('R', 'P', 'S')
+    MOVE_TO_IDX = {'R': 0, 'P': 1, 'S': 2}
 
-    records = []
-    model_wins = player_wins = ties = 0
+    recorder = RoundRecorder(num_games, result_labels=('tie', 'win', 'loss'))
 
     for i in range(num_games):
-        m_move = agent.get_move()
-        
-        model_prediction = reverse_counter(m_move)
-        p_move = player.get_move()
-
-        res = round_result(m_move, p_move)
-        if res == 'win':
-            model_wins += 1
-        elif res == 'loss':
-            player_wins += 1
-        else:
-            ties += 1
-
-        records.append({
-            'round': i + 1,
-            'model_move': m_move,
-            'opponent_move': p_move,
-            'model_prediction': model_prediction, 
-            'result': res,
-            'cum_model_wins': model_wins,
-            'cum_player_wins': player_wins,
-            'cum_ties': ties
-        })
+        # The wrapped model is the string I/O edge
+        m_str = agent.get_move()
+        m_move = MOVE_TO_IDX[m_str]
+        p_move = player.get_move_idx()
+        recorder.record(m_move, p_move)
 
         # Let agents observe outcomes
         try:
-            agent.observe(opponent_move=p_move, my_move=m_move)
+            agent.observe(opponent_move=MOVES[p_move], my_move=m_str)
         except Exception:
             pass
         try:
-            if hasattr(player, 'observe'):
-                player.observe(opponent_move=m_move)
+            player.observe_idx(m_move)
         except Exception:
             pass
 
-    df = pd.DataFrame.from_records(records)
+    df = recorder.to_frame()
     if to_csv:
         df.to_csv(to_csv, index=False)
     return df
@@ -0,0 +1,53 @@
+from .recorder import RoundRecorder, frame_from_moves
+from .vectorized import is_vectorizable, play_vectorized, simulate_vectorized
+from .arena import play_arena, simulate_arena
+from .csv_writer import ChunkedCSVWriter
+from .engine import simulate_predictor_vs_player
+from .formats import load_results, read_metadata, write_results
+from .sampled import SampledCSVWriter, rolling_win_rate, load_rolling
+from .binlog import BinaryLog, BinaryLogWriter
+from .stopping import WilsonStop, wilson_interval
+from .checkpoint import save_checkpoint, load_checkpoint, clear_checkpoint
+from .cache import ResultCache, cell_key
+from .league import League, entrants, run_match
+from .telemetry import Telemetry
+from .stream import Round, Sink, iter_rounds, run_stream, RunningStats, CSVSink, EarlyStop, LivePlot
+
+__all__ = [
+    "RoundRecorder",
+    "frame_from_moves",
+    "is_vectorizable",
+    "play_vectorized",
+    "simulate_vectorized",
+    "play_arena",
+    "simulate_arena",
+    "ChunkedCSVWriter",
+    "simulate_predictor_vs_player",
+    "load_results",
+    "read_metadata",
+    "write_results",
+    "SampledCSVWriter",
+    "rolling_win_rate",
+    "load_rolling",
+    "BinaryLog",
+    "BinaryLogWriter",
+    "WilsonStop",
+    "wilson_interval",
+    "save_checkpoint",
+    "load_checkpoint",
+    "clear_checkpoint",
+    "ResultCache",
+    "cell_key",
+    "League",
+    "entrants",
+    "run_match",
+    "Telemetry",
+    "Round",
+    "Sink",
+    "iter_rounds",
+    "run_stream",
+    "RunningStats",
+    "CSVSink",
+    "EarlyStop",
+    "LivePlot",
+]
@@ -0,0 +1,76 @@
+from .recorder import RoundRecorder
+from .telemetry import ROUND_PHASES
+
+import pandas as pd
+import time
+
+'''
+Predictor arena
+
+Two RPSPredictors playing each other: each round both predict_idx, the
+moves go into one RoundRecorder (model = side A, opponent = side B) and
+each side learns from the other's move with update_idx. No Player
+wrapper sits in between, so predictor-vs-predictor runs cost the same
+per round as predictor-vs-player ones.
+
+simulate_predictor_vs_player accepts a predictor on the player side and
+plays it through here, so checkpoints, early stopping and every output
+format work for arena runs too.
+'''
+
+def is_predictor(agent) -> bool:
+    # An RPSPredictor (or anything shaped like one) rather than a Player
+    return (callable(getattr(agent, "predict_idx", None))
+            and callable(getattr(agent, "update_idx", None))
+            and not callable(getattr(agent, "get_move_idx", None)))
+
+
+def play_arena_rounds(model_a, model_b, recorder: RoundRecorder, n: int) -> None:
+    # Plays n rounds of A vs B into the recorder
+    record = recorder.record
+    predict_a, predict_b = model_a.predict_idx, model_b.predict_idx
+    update_a, update_b = model_a.update_idx, model_b.update_idx
+    for _ in range(n):
+        a_move = predict_a()
+        b_move = predict_b()
+        record(a_move, b_move)
+
+        update_a(b_move, a_move)
+        update_b(a_move, b_move)
+
+
+def play_arena_rounds_timed(model_a, model_b, recorder: RoundRecorder, n: int, telemetry) -> None:
+    # play_arena_rounds with per-call timers: B's predict / update count as get_move / observe
+    clock = time.perf_counter_ns
+    record = recorder.record
+    predict = get_move = recorded = update = observe = 0
+    for _ in range(n):
+        t0 = clock()
+        a_move = model_a.predict_idx()
+        t1 = clock()
+        b_move = model_b.predict_idx()
+        t2 = clock()
+        record(a_move, b_move)
+        t3 = clock()
+        model_a.update_idx(b_move, a_move)
+        t4 = clock()
+        model_b.update_idx(a_move, b_move)
+        t5 = clock()
+        predict += t1 - t0
+        get_move += t2 - t1
+        recorded += t3 - t2
+        update += t4 - t3
+        observe += t5 - t4
+    for phase, ns in zip(ROUND_PHASES, (predict, get_move, recorded, update, observe)):
+        telemetry.add(phase, ns)
+
+
+def play_arena(model_a, model_b, num_games: int) -> RoundRecorder:
+    recorder = RoundRecorder(num_games)
+    play_arena_rounds(model_a, model_b, recorder, num_games)
+    return recorder
+
+
+def simulate_arena(model_a, model_b, num_games: int) -> pd.DataFrame:
+    # Same as play_arena, returning the usual results frame (A is the model)
+    return play_arena(model_a, model_b, num_games).to_frame()
@@ -0,0 +1,265 @@
+from .recorder import RESULTS, frame_from_moves
+from .csv_writer import ChunkedCSVWriter
+
+import json
+import os
+import struct
+import numpy as np
+import pandas as pd
+
+'''
+Packed binary match log (.rpsb)
+
+Archival format for very long runs: 2 bits per move, so one byte holds
+two rounds (model, opponent, model, opponent from the low bits up).
+
+    magic     8 bytes   b"RPSBIN\\x01\\x00"
+    rounds    uint64    rounds in the file (updated on every flush)
+    meta_len  uint32    length of the JSON header
+    meta      JSON      predictor, player, seed, ... (run metadata)
+    padding             up to a multiple of 8 bytes
+    data      ceil(rounds / 2) bytes
+
+BinaryLog memory-maps the data: round i lives in byte i // 2, so any
+round range is located in O(1) and only the bytes of that range are
+decoded. Everything in the results CSV schema is derived on demand.
+'''
+
+MAGIC = b"RPSBIN\x01\x00"
+EXTENSION = ".rpsb"
+_FIXED = struct.Struct("<8sQI")
+
+# byte -> the 4 moves it holds (model, opponent, model, opponent)
+_UNPACK = np.array([[(b >> shift) & 3 for shift in (0, 2, 4, 6)] for b in range(256)], dtype=np.int8)
+
+
+def pack_moves(model_moves: np.ndarray, opponent_moves: np.ndarray) -> np.ndarray:
+    # Packs an even number of rounds into n / 2 bytes
+    moves = np.empty(2 * len(model_moves), dtype=np.uint8)
+    moves[0::2] = model_moves
+    moves[1::2] = opponent_moves
+    quads = moves.reshape(-1, 4)
+    return quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+
+
+class BinaryLogWriter:
+    '''
+    Streaming writer with the same interface as ChunkedCSVWriter:
+
+    with BinaryLogWriter(path, {"predictor": "markov", "player": "counter", "seed": 42}) as writer:
+        writer.write(model_moves, opponent_moves)
+    '''
+
+    def __init__(self, path: str, metadata: dict | None = None, flush_every: int | None = None,
+                 resume_from: dict | None = None):
+        self.path = path
+        self.metadata = metadata or {}
+        self.flush_every = flush_every
+        self.rounds = 0
+        self._pending = None    # (model, opponent) of an unpaired last round
+        self._unflushed = 0
+
+        os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
+        if resume_from is not None:
+            # Continue an earlier writer of this file (see checkpoint_state)
+            os.truncate(path, resume_from["offset"])
+            self.rounds = resume_from["rounds"]
+            self._pending = resume_from["pending"]
+            self.file = open(path, "r+b")
+            self.file.seek(0, os.SEEK_END)
+            return
+
+        meta = json.dumps(self.metadata).encode()
+        header = _FIXED.pack(MAGIC, 0, len(meta)) + meta
+        header += b"\0" * (-len(header) % 8)
+        self.file = open(path, "wb")
+        self.file.write(header)
+
+    def write(self, model_moves: np.ndarray, opponent_moves: np.ndarray) -> None:
+        model_moves = np.asarray(model_moves, dtype=np.uint8)
+        opponent_moves = np.asarray(opponent_moves, dtype=np.uint8)
+        n = len(model_moves)
+        if self._pending is not None and n:
+            model_moves = np.concatenate(([self._pending[0]], model_moves))
+            opponent_moves = np.concatenate(([self._pending[1]], opponent_moves))
+            self._pending = None
+        if len(model_moves) % 2:
+            self._pending = (model_moves[-1], opponent_moves[-1])
+            model_moves, opponent_moves = model_moves[:-1], opponent_moves[:-1]
+
+        self.file.write(pack_moves(model_moves, opponent_moves).tobytes())
+        self.rounds += n
+        self._unflushed += n
+        if self.flush_every is None or self._unflushed >= self.flush_every:
+            self.flush()
+
+    def write_chunked(self, model_moves: np.ndarray, opponent_moves: np.ndarray,
+                      chunk_size: int = 1 << 20) -> None:
+        for start in range(0, len(model_moves), chunk_size):
+            self.write(model_moves[start:start + chunk_size], opponent_moves[start:start + chunk_size])
+
+    def flush(self) -> None:
+        # Paired rounds are on disk; record how many so the file is readable as is
+        self.file.flush()
+        self._write_round_count(self.rounds - (self._pending is not None))
+        self._unflushed = 0
+
+    def checkpoint_state(self) -> dict:
+        self.flush()
+        pending = None if self._pending is None else tuple(int(m) for m in self._pending)
+        return {"rounds": self.rounds, "pending": pending, "offset": self.file.tell()}
+
+    def _write_round_count(self, rounds: int) -> None:
+        end = self.file.tell()
+        self.file.seek(8)
+        self.file.write(struct.pack("<Q", rounds))
+        self.file.seek(end)
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.file.closed:
+            return
+        if self._pending is not None:
+            model, opponent = self._pending
+            self.file.write(bytes([int(model) | (int(opponent) << 2)]))
+            self._pending = None
+        self._write_round_count(self.rounds)
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BinaryLog:
+    '''
+    Memory-mapped reader of a .rpsb file.
+
+    log = BinaryLog(path)
+    log.metadata, log.rounds
+    log.packed                     # zero-copy uint8 view of the data
+    log[1000:2000]                 # O(1) range, decoded only when used
+    log.model_moves(a, b), log.results(a, b), log.to_frame(a, b)
+
+    Round indices are 0-based here; the frame's "round" column is 1-based
+    like the CSV.
+    '''
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            magic, rounds, meta_len = _FIXED.unpack(f.read(_FIXED.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an RPS binary log.")
+            self.metadata = json.loads(f.read(meta_len) or b"{}")
+        self.path = path
+        self.rounds = rounds
+        offset = _FIXED.size + meta_len
+        offset += -offset % 8
+        nbytes = (rounds + 1) // 2
+        self.packed = (np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=(nbytes,))
+                       if nbytes else np.zeros(0, dtype=np.uint8))
+
+    @property
+    def predictor(self):
+        return self.metadata.get("predictor")
+
+    @property
+    def player(self):
+        return self.metadata.get("player")
+
+    @property
+    def seed(self):
+        return self.metadata.get("seed")
+
+    def __len__(self) -> int:
+        return self.rounds
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError("BinaryLog only supports range slicing, e.g. log[a:b].")
+        start, stop, step = index.indices(self.rounds)
+        if step != 1:
+            raise ValueError("BinaryLog slices must be contiguous.")
+        return RoundRange(self, start, max(start, stop))
+
+    def _unpack(self, start: int, stop: int) -> np.ndarray:
+        # (stop - start, 2) int8 array of (model, opponent) moves
+        first, last = start // 2, (stop + 1) // 2
+        moves = _UNPACK[self.packed[first:last]].reshape(-1, 2)
+        offset = start - 2 * first
+        return moves[offset:offset + stop - start]
+
+    def _bounds(self, start, stop) -> tuple[int, int]:
+        start, stop, _ = slice(start, stop).indices(self.rounds)
+        return start, max(start, stop)
+
+    def model_moves(self, start: int | None = None, stop: int | None = None) -> np.ndarray:
+        return self._unpack(*self._bounds(start, stop))[:, 0]
+
+    def opponent_moves(self, start: int | None = None, stop: int | None = None) -> np.ndarray:
+        return self._unpack(*self._bounds(start, stop))[:, 1]
+
+    # Integer result codes of the model (0 tie, 1 win, 2 lose)
+    def results(self, start: int | None = None, stop: int | None = None) -> np.ndarray:
+        moves = self._unpack(*self._bounds(start, stop))
+        return (moves[:, 0] - moves[:, 1]) % 3
+
+    def totals(self, start: int | None = None, stop: int | None = None) -> tuple[int, int, int]:
+        # (wins, losses, ties) of the model over a range
+        counts = np.bincount(self.results(start, stop), minlength=3)
+        return int(counts[1]), int(counts[2]), int(counts[0])
+
+    def to_frame(self, start: int | None = None, stop: int | None = None,
+                 result_labels: tuple[str, str, str] = RESULTS) -> pd.DataFrame:
+        '''
+        The results CSV schema for a range of rounds. The cumulative
+        columns count from round 1, as in the full CSV (their offset is
+        one vectorized pass over the packed bytes before `start`).
+        '''
+        start, stop = self._bounds(start, stop)
+        moves = self._unpack(start, stop)
+        return frame_from_moves(moves[:, 0], moves[:, 1],
+                                result_labels=result_labels,
+                                start_round=start + 1,
+                                start_totals=self.totals(0, start))
+
+    def to_csv(self, path: str, chunk_size: int = 1 << 20) -> None:
+        # Writes the full results CSV, byte-identical to a CSV run of the same match
+        with ChunkedCSVWriter(path) as writer:
+            for start in range(0, max(self.rounds, 1), chunk_size):
+                moves = self._unpack(start, min(start + chunk_size, self.rounds))
+                writer.write(moves[:, 0], moves[:, 1])
+
+
+class RoundRange:
+    # Lazy [start, stop) window of a BinaryLog (see BinaryLog.__getitem__)
+    def __init__(self, log: BinaryLog, start: int, stop: int):
+        self.log = log
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            raise ValueError("BinaryLog slices must be contiguous.")
+        return RoundRange(self.log, self.start + start, self.start + max(start, stop))
+
+    def model_moves(self) -> np.ndarray:
+        return self.log.model_moves(self.start, self.stop)
+
+    def opponent_moves(self) -> np.ndarray:
+        return self.log.opponent_moves(self.start, self.stop)
+
+    def results(self) -> np.ndarray:
+        return self.log.results(self.start, self.stop)
+
+    def totals(self) -> tuple[int, int, int]:
+        return self.log.totals(self.start, self.stop)
+
+    def to_frame(self, **kwargs) -> pd.DataFrame:
+        return self.log.to_frame(self.start, self.stop, **kwargs)
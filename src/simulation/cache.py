@@ -0,0 +1,139 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+'''
+Result cache
+
+A grid cell is fully determined by its agents (class and kwargs), seed,
+round count, output options and the source code that produced it. The
+cache key is a hash of all of that; the index in
+<output_dir>/.cache/index.json keeps, per cell, the key of its last run,
+the files it wrote and its summary. A cell whose key matches and whose
+files are untouched is not run again.
+
+Not part of the key: Q-tables saved by QLearningPredictor.save_q_table
+in the working directory (run with --no-cache after saving one).
+'''
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+SIMULATION_DIR = os.path.join(SRC_DIR, "simulation")
+INDEX_FILE = os.path.join(".cache", "index.json")
+
+
+def _local_file(obj) -> str | None:
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return None
+    # Skips builtins and frozen modules ("<frozen abc>") as well as anything outside src/
+    if not path or not os.path.isabs(path):
+        return None
+    # Normalized, so the same file found as predictors/../players/player.py
+    # (qlearning_predictor's sys.path entry) hashes the same
+    path = os.path.realpath(path)
+    if path.startswith(SRC_DIR + os.sep):
+        return path
+    return None
+
+
+def source_files(*classes) -> list[str]:
+    '''
+    Source files the classes depend on inside src/: the modules of every
+    class in their MRO, plus the local modules, classes and functions
+    those modules import (one level). The simulation package is always
+    included.
+    '''
+    files = set()
+    for cls in classes:
+        for klass in cls.__mro__:
+            module = sys.modules.get(klass.__module__)
+            path = module and _local_file(module)
+            if not path:
+                continue
+            files.add(path)
+            for value in vars(module).values():
+                if inspect.ismodule(value) or inspect.isclass(value) or inspect.isfunction(value):
+                    dep = _local_file(value)
+                    if dep:
+                        files.add(dep)
+
+    for name in os.listdir(SIMULATION_DIR):
+        if name.endswith(".py") and name != "cache.py":
+            files.add(os.path.join(SIMULATION_DIR, name))
+    return sorted(files)
+
+
+def source_hash(files: list[str]) -> str:
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(os.path.relpath(path, SRC_DIR).encode())
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def cell_key(config: dict, classes: list[type]) -> str:
+    '''
+    Hash of a JSON-serializable cell config (names, kwargs, seed,
+    num_games, format, ...) together with the classes' qualified names
+    and the source hash of everything they depend on.
+    '''
+    payload = {
+        "config": config,
+        "classes": [f"{cls.__module__}.{cls.__qualname__}" for cls in classes],
+        "sources": source_hash(source_files(*classes)),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+class ResultCache:
+    '''
+    Index of the last run of every cell in an output directory.
+
+    cache = ResultCache(output_dir)
+    summary = cache.get(cell, key)        # None on a miss / stale files
+    cache.put(cell, key, summary, files)  # after running the cell
+
+    A hit needs the cell's last key to equal `key` and its files to be
+    unchanged since (size and modification time).
+    '''
+
+    def __init__(self, output_dir: str):
+        self.path = os.path.join(output_dir, INDEX_FILE)
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self.entries = json.load(f)
+
+    def get(self, cell: str, key: str) -> dict | None:
+        entry = self.entries.get(cell)
+        if entry is None or entry["key"] != key:
+            return None
+        for path, stamp in entry["files"].items():
+            if not os.path.exists(path) or _stamp(path) != stamp:
+                return None
+        return entry["summary"]
+
+    def put(self, cell: str, key: str, summary: dict, files: list[str]) -> None:
+        self.entries[cell] = {
+            "key": key,
+            "summary": summary,
+            "files": {path: _stamp(path) for path in files if os.path.exists(path)},
+        }
+        self.save()
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(tmp, self.path)
+
+
+def _stamp(path: str) -> list[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,24 @@
+from predictors.atomic import save_pickle, load_pickle
+
+import os
+
+'''
+Checkpoints
+
+A checkpoint is one pickle holding everything needed to continue a run:
+the predictor and player objects (with their learned state and their
+random streams), the round offset, the running totals and the state of
+the output writer (see ChunkedCSVWriter.checkpoint_state). Files are
+replaced atomically, so a run killed while saving keeps the previous
+checkpoint.
+'''
+
+
+# The same atomic write as the Q-learning training checkpoints
+save_checkpoint = save_pickle
+load_checkpoint = load_pickle
+
+
+def clear_checkpoint(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
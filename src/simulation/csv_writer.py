@@ -0,0 +1,95 @@
+from .recorder import RESULTS, frame_from_moves
+
+import numpy as np
+import os
+
+'''
+Chunked CSV writer
+
+Appends a run to its results CSV a chunk at a time while the simulation
+is still going, instead of one df.to_csv at the end. Every chunk is
+framed with the round / cumulative offsets of the chunks before it, so
+the file is byte-identical to the one-shot output, and only the rounds
+since the last flush are lost if a run is interrupted.
+'''
+
+CHUNK_SIZE = 65536
+
+
+class ChunkedCSVWriter:
+    '''
+    with ChunkedCSVWriter(path) as writer:
+        writer.write(model_moves, opponent_moves)   # any number of rounds
+        ...
+
+    flush_every: flush the file once at least this many rounds were
+    written since the last flush (default: after every write).
+    resume_from: a checkpoint_state() of an earlier writer of the same
+    file; anything written after it is cut off and writing continues.
+    '''
+
+    def __init__(self, path: str,
+                 flush_every: int | None = None,
+                 with_prediction: bool = True,
+                 result_labels: tuple[str, str, str] = RESULTS,
+                 resume_from: dict | None = None):
+        self.path = path
+        self.flush_every = flush_every
+        self.with_prediction = with_prediction
+        self.result_labels = result_labels
+        self.rounds = 0
+        self.totals = (0, 0, 0)     # wins, losses, ties so far
+        self._unflushed = 0
+
+        os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
+        if resume_from is None:
+            self.file = open(path, "w", newline="")
+        else:
+            os.truncate(path, resume_from["offset"])
+            self.rounds = resume_from["rounds"]
+            self.totals = tuple(resume_from["totals"])
+            self.file = open(path, "a", newline="")
+
+    def write(self, model_moves: np.ndarray, opponent_moves: np.ndarray) -> None:
+        n = len(model_moves)
+        if n == 0 and self.rounds > 0:
+            return
+        df = frame_from_moves(model_moves, opponent_moves,
+                              with_prediction=self.with_prediction,
+                              result_labels=self.result_labels,
+                              start_round=self.rounds + 1,
+                              start_totals=self.totals)
+        df.to_csv(self.file, header=self.rounds == 0, index=False)
+
+        if n:
+            last = df.iloc[-1]
+            self.totals = (int(last["cum_model_wins"]), int(last["cum_player_wins"]), int(last["cum_ties"]))
+        self.rounds += n
+        self._unflushed += n
+        if self.flush_every is None or self._unflushed >= self.flush_every:
+            self.flush()
+
+    def write_chunked(self, model_moves: np.ndarray, opponent_moves: np.ndarray,
+                      chunk_size: int = CHUNK_SIZE) -> None:
+        # Writes long arrays in chunk_size slices (bounds the temporary frames)
+        for start in range(0, max(len(model_moves), 1), chunk_size):
+            self.write(model_moves[start:start + chunk_size], opponent_moves[start:start + chunk_size])
+
+    def flush(self) -> None:
+        self.file.flush()
+        self._unflushed = 0
+
+    def checkpoint_state(self) -> dict:
+        # Flushes and returns what resume_from needs to continue this file
+        self.flush()
+        return {"rounds": self.rounds, "totals": self.totals, "offset": os.path.getsize(self.path)}
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,285 @@
+from .recorder import RoundRecorder, frame_from_moves
+from .vectorized import is_vectorizable, play_vectorized
+from .arena import is_predictor, play_arena_rounds, play_arena_rounds_timed
+from .telemetry import ROUND_PHASES, Telemetry
+from .csv_writer import CHUNK_SIZE, ChunkedCSVWriter
+from .formats import is_columnar, require_pyarrow, write_results
+from .binlog import EXTENSION as BINARY_EXTENSION, BinaryLogWriter
+from .sampled import SampledCSVWriter
+from .checkpoint import clear_checkpoint, load_checkpoint, save_checkpoint
+
+from contextlib import nullcontext
+import numpy as np
+import time
+
+'''
+Simulation engine
+
+Plays a predictor against a player for a fixed number of rounds.
+Moves and results are integer codes inside the loop (R=0, P=1, S=2;
+tie=0, win=1, lose=2) and only become strings when the DataFrame is built.
+'''
+
+# Rounds per vectorized draw. The draws only depend on this, not on how a
+# run is split up by checkpoints or early stopping, and runs up to this
+# size are a single draw.
+VECTORIZED_BATCH = 1 << 20
+
+def simulate_predictor_vs_player(predictor_cls, player_cls, num_games=100000, to_csv=None, vectorize=True,
+                                 chunk_size=CHUNK_SIZE, flush_every=None, return_frame=True,
+                                 to_file=None, metadata=None, early_stop=None,
+                                 checkpoint=None, checkpoint_every=CHUNK_SIZE, resume=False,
+                                 sample_every=None, telemetry=False):
+    '''
+    vectorize: run stateless pairings (e.g. RandomPredictor vs RandomPlayer)
+    as whole arrays instead of round by round, see vectorized.py
+
+    player_cls may also build an RPSPredictor: the two predictors then
+    play each other directly (see arena.py).
+
+    to_csv is written incrementally, chunk_size rounds at a time, and
+    flushed every flush_every rounds (default: every chunk).
+    return_frame=False skips building the full DataFrame and returns the
+    summary dict instead (rounds, model_wins, player_wins, ties); unless
+    the output is columnar, only one block of rounds is then held in
+    memory at a time.
+
+    to_file: like to_csv, but the format follows the extension. Parquet /
+    Feather files (see formats.py) are written once at the end, with
+    `metadata` embedded; binary logs (.rpsb, see binlog.py) are streamed
+    like the CSV, with `metadata` in their header.
+
+    early_stop: a WilsonStop (see stopping.py). num_games becomes the cap
+    and the run ends once the win-rate interval is narrow enough; the
+    stopping round is returned as "stopped_at" (df.attrs["stopped_at"]
+    for frames), None if the run went the full num_games.
+
+    checkpoint: path of a checkpoint file (see checkpoint.py), saved every
+    checkpoint_every rounds (vectorized runs: every VECTORIZED_BATCH
+    rounds) and removed when the run completes.
+    resume=True continues from it if it exists: the agents, their random
+    streams and the round offset are restored and the output file is
+    appended to. The returned frame then only holds the resumed rounds
+    (with their true round numbers and cumulative counts).
+
+    sample_every: CSV output keeps only every sample_every-th row, plus
+    per-block aggregates next to it (see sampled.py). The returned frame
+    still holds every round.
+
+    telemetry: True or a Telemetry (see telemetry.py) times every phase
+    of the loop and prints rounds/sec, ns per phase and the peak memory
+    at the end; Telemetry(sidecar=True) also writes them as JSON next to
+    the output file. The figures are returned as "telemetry"
+    (df.attrs["telemetry"] for frames).
+    '''
+    path = to_file or to_csv
+    columnar = bool(path) and is_columnar(path)
+    if columnar:
+        require_pyarrow()  # fail before the run, not after it
+        if checkpoint:
+            raise ValueError("Checkpoints need an appendable output (.csv or .rpsb), not a columnar file.")
+    if sample_every and path and not path.lower().endswith(".csv"):
+        raise ValueError(f"sample_every needs a .csv output, got {path}.")
+
+    state = load_checkpoint(checkpoint) if checkpoint and resume else None
+    if state is None:
+        predictor = predictor_cls() if callable(predictor_cls) else predictor_cls
+        player = player_cls()
+        offset, totals = 0, (0, 0, 0)
+    else:
+        predictor, player = state["predictor"], state["player"]
+        offset, totals = state["rounds"], tuple(state["totals"])
+
+    writer_state = state["writer"] if state else None
+    if not path or columnar:
+        writer = None
+    elif path.lower().endswith(BINARY_EXTENSION):
+        writer = BinaryLogWriter(path, metadata, flush_every=flush_every, resume_from=writer_state)
+    elif sample_every:
+        writer = SampledCSVWriter(path, every=sample_every, flush_every=flush_every, resume_from=writer_state)
+    else:
+        writer = ChunkedCSVWriter(path, flush_every=flush_every, resume_from=writer_state)
+
+    if telemetry is True:
+        telemetry = Telemetry()
+    # Times a block-level phase, or does nothing without telemetry
+    timed = telemetry.phase if telemetry else lambda name: nullcontext()
+
+    vectorized = vectorize and is_vectorizable(predictor, player)
+    # A predictor on the player side is driven directly, see arena.py
+    if telemetry:
+        timed_loop = play_arena_rounds_timed if is_predictor(player) else _play_loop_timed
+        play_rounds = lambda predictor, player, recorder, n: timed_loop(predictor, player, recorder, n, telemetry)
+    else:
+        play_rounds = play_arena_rounds if is_predictor(player) else _play_loop
+    if vectorized:
+        # Fixed-size draws, so checkpointing or stopping a run never changes
+        # its rounds: checkpoints fall on batch boundaries and early
+        # stopping is checked inside the batch (at multiples of check_every,
+        # like every run, see _check_stop)
+        block = VECTORIZED_BATCH
+    else:
+        block = early_stop.check_every if early_stop else chunk_size
+        if checkpoint:
+            block = min(block, checkpoint_every)
+    block = max(block, 1)
+
+    # Only the rounds of this call are recorded; `offset` rounds (and their
+    # `totals`) were played before the checkpoint. Without a frame to
+    # return or a columnar file to write, the recorder is one block that
+    # is handed to the writer and reused, so memory stays flat however
+    # long the run
+    remaining = max(num_games - offset, 0)
+    keep_all = return_frame or columnar
+    recorder = RoundRecorder(remaining if keep_all else min(block, remaining))
+    played = 0
+    run_totals = list(totals)
+    stopped_at = None
+    if telemetry:
+        telemetry.start()
+    try:
+        while played < remaining:
+            if not keep_all:
+                recorder.n = 0
+            start = recorder.n
+            n = min(block, remaining - played)
+            if vectorized:
+                with timed("vectorized"):
+                    batch = play_vectorized(predictor, player, n)
+                    recorder.extend(batch.model_moves, batch.opponent_moves)
+            else:
+                play_rounds(predictor, player, recorder, n)
+
+            if early_stop:
+                base = offset + played - start  # rounds before recorder position 0
+                stop = _check_stop(early_stop, recorder, start, base, run_totals[0])
+                if stop is not None:
+                    # A vectorized batch may have run past the stopping round
+                    recorder.n = stop
+                    stopped_at = base + stop
+            if writer:
+                with timed("write"):
+                    writer.write_chunked(recorder.model_moves[start:recorder.n],
+                                         recorder.opponent_moves[start:recorder.n], chunk_size)
+            counts = np.bincount(recorder.results(start), minlength=3)
+            run_totals[0] += int(counts[1])
+            run_totals[1] += int(counts[2])
+            run_totals[2] += int(counts[0])
+            played += recorder.n - start
+            if stopped_at is not None:
+                break
+            if checkpoint and played < remaining:
+                with timed("checkpoint"):
+                    _save(checkpoint, predictor, player, offset + played, run_totals, writer)
+        if writer and num_games == 0:
+            writer.write(recorder.model_moves[:0], recorder.opponent_moves[:0])
+    finally:
+        if writer:
+            with timed("write"):
+                writer.close()
+    if checkpoint:
+        clear_checkpoint(checkpoint)
+
+    if columnar:
+        with timed("frame"):
+            write_results(recorder.to_frame(categorical=True), path,
+                          {**(metadata or {}), "stopped_at": stopped_at})
+
+    if not return_frame:
+        if telemetry:
+            telemetry.finish(played, path)
+        return {"rounds": offset + played, "model_wins": run_totals[0], "player_wins": run_totals[1],
+                "ties": run_totals[2], "stopped_at": stopped_at,
+                **({"telemetry": telemetry.as_dict()} if telemetry else {})}
+    with timed("frame"):
+        df = frame_from_moves(recorder.model_moves[:recorder.n], recorder.opponent_moves[:recorder.n],
+                              start_round=offset + 1, start_totals=totals)
+    df.attrs["stopped_at"] = stopped_at
+    if telemetry:
+        telemetry.finish(played, path)
+        df.attrs["telemetry"] = telemetry.as_dict()
+    return df
+
+
+def _play_loop(predictor, player, recorder: RoundRecorder, n: int) -> None:
+    # Plays n rounds one by one into the recorder
+    record = recorder.record
+    for _ in range(n):
+        ai_move = predictor.predict_idx()
+        p_move = player.get_move_idx()
+        record(ai_move, p_move)
+
+        predictor.update_idx(p_move, ai_move)
+        player.observe_idx(ai_move)
+
+
+def _play_loop_timed(predictor, player, recorder: RoundRecorder, n: int, telemetry: Telemetry) -> None:
+    # _play_loop with a clock read between the calls, summed per phase
+    clock = time.perf_counter_ns
+    record = recorder.record
+    predict = get_move = recorded = update = observe = 0
+    for _ in range(n):
+        t0 = clock()
+        ai_move = predictor.predict_idx()
+        t1 = clock()
+        p_move = player.get_move_idx()
+        t2 = clock()
+        record(ai_move, p_move)
+        t3 = clock()
+        predictor.update_idx(p_move, ai_move)
+        t4 = clock()
+        player.observe_idx(ai_move)
+        t5 = clock()
+        predict += t1 - t0
+        get_move += t2 - t1
+        recorded += t3 - t2
+        update += t4 - t3
+        observe += t5 - t4
+    for phase, ns in zip(ROUND_PHASES, (predict, get_move, recorded, update, observe)):
+        telemetry.add(phase, ns)
+
+
+def _check_stop(early_stop, recorder: RoundRecorder, start: int, base: int, wins: int) -> int | None:
+    # Checks the rule at every multiple of check_every among the new rounds
+    # from `start` (`base` rounds and `wins` wins before recorder position 0),
+    # so blocks, checkpoints and resume offsets never move the checks;
+    # returns the recorder position to stop at, or None
+    step = max(early_stop.check_every, 1)
+    results = recorder.results(start)
+    checked = 0
+    for end in range(((base + start) // step + 1) * step - base, recorder.n + 1, step):
+        wins += int(np.count_nonzero(results[checked:end - start] == 1))
+        checked = end - start
+        if early_stop.satisfied(wins, base + end):
+            return end
+    return None
+
+
+def _save(path, predictor, player, rounds, totals, writer) -> None:
+    save_checkpoint(path, {
+        "predictor": predictor,
+        "player": player,
+        "rounds": rounds,
+        "totals": tuple(totals),
+        "writer": writer.checkpoint_state() if writer else None,
+    })
+
+
+if __name__ == "__main__":
+    # python -m simulation.engine (from src/): checkpointing must not move the stopping round
+    import os
+    import tempfile
+    from predictors.markov_predictor import MarkovPredictor
+    from players.repeater_player import RepeaterPlayer
+    from .stopping import WilsonStop
+
+    checkpoint = os.path.join(tempfile.mkdtemp(), "run.ckpt")
+    stops = {}
+    for every in (None, 700, 1000):
+        summary = simulate_predictor_vs_player(lambda: MarkovPredictor(rng=1), lambda: RepeaterPlayer(rng=2),
+                                               num_games=20000, return_frame=False,
+                                               early_stop=WilsonStop(0.03), checkpoint=every and checkpoint,
+                                               checkpoint_every=every or CHUNK_SIZE)
+        stops[every] = summary["stopped_at"]
+    print("stopped_at by checkpoint_every:", stops)
+    assert len(set(stops.values())) == 1, stops
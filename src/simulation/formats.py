@@ -0,0 +1,161 @@
+from .recorder import MOVES, RESULTS
+from .binlog import EXTENSION as BINARY_EXTENSION, BinaryLog, BinaryLogWriter
+
+import json
+import os
+import pandas as pd
+
+'''
+Results file formats
+
+Besides the results CSV, runs can be stored columnar as Parquet
+(.parquet) or Feather / Arrow IPC (.feather, .arrow). The move and result
+columns are categoricals over fixed categories, so on disk they are int8
+dictionary codes (R=0, P=1, S=2; tie=0, win=1, lose=2) instead of
+repeated strings, and the run metadata (predictor, player, seed, ...)
+travels inside the file.
+
+load_results() reads any of them into the usual DataFrame; the
+categorical columns compare and iterate as the same strings as the CSV.
+Columnar formats need pyarrow (optional, imported on first use).
+The packed binary log (.rpsb, see binlog.py) is loaded the same way.
+'''
+
+COLUMNAR_EXTENSIONS = (".parquet", ".feather", ".arrow")
+EXTENSIONS = (".csv",) + COLUMNAR_EXTENSIONS + (BINARY_EXTENSION,)
+
+MOVE_COLUMNS = ("model_move", "opponent_move", "model_prediction")
+
+# Key of the run metadata in the Arrow schema metadata
+METADATA_KEY = b"rps_metadata"
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet/Feather results need pyarrow (pip install pyarrow).") from e
+    return pyarrow
+
+
+def is_columnar(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in COLUMNAR_EXTENSIONS
+
+
+def categorize(df: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Converts the move/result string columns of a results frame to
+    categoricals (codes = integer move / result codes). Result labels
+    outside (tie, win, lose), e.g. 'loss', keep their own categories.
+    '''
+    df = df.copy()
+    for col in MOVE_COLUMNS:
+        if col in df and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = pd.Categorical(df[col], categories=MOVES)
+    if "result" in df and not isinstance(df["result"].dtype, pd.CategoricalDtype):
+        labels = set(df["result"].dropna().unique())
+        categories = RESULTS if labels <= set(RESULTS) else sorted(labels)
+        df["result"] = pd.Categorical(df["result"], categories=categories)
+    return df
+
+
+def write_results(df: pd.DataFrame, path: str, metadata: dict | None = None) -> str:
+    '''
+    Writes a results frame in the format given by the extension of `path`.
+    metadata (JSON-serializable) is embedded in columnar files and
+    ignored for CSV. Returns the path.
+    '''
+    os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in EXTENSIONS:
+        raise ValueError(f"Unknown results format '{ext}'. Expected one of {EXTENSIONS}.")
+
+    if ext == ".csv":
+        df.to_csv(path, index=False)
+        return path
+
+    if ext == BINARY_EXTENSION:
+        from predictors.base_predictor import RPSPredictor
+
+        with BinaryLogWriter(path, metadata) as writer:
+            writer.write(RPSPredictor.encode_batch(df["model_move"]),
+                         RPSPredictor.encode_batch(df["opponent_move"]))
+        return path
+
+    pa = require_pyarrow()
+    table = pa.Table.from_pandas(categorize(df), preserve_index=False)
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[METADATA_KEY] = json.dumps(metadata or {}).encode()
+    table = table.replace_schema_metadata(schema_metadata)
+
+    if ext == ".parquet":
+        pa.parquet.write_table(table, path)
+    else:
+        pa.feather.write_feather(table, path)
+    return path
+
+
+def resolve_results_path(path: str) -> str:
+    '''
+    Returns `path` if it exists, otherwise the first existing file with
+    the same name and another results extension (so scripts pointing at
+    results_x.csv pick up results_x.parquet when that is what was written).
+    '''
+    if os.path.exists(path):
+        return path
+    stem, ext = os.path.splitext(path)
+    if ext.lower() in EXTENSIONS:
+        for other in EXTENSIONS:
+            if os.path.exists(stem + other):
+                return stem + other
+    raise FileNotFoundError(f"No results file for {path}")
+
+
+def load_results(path: str, columns: list[str] | None = None) -> pd.DataFrame:
+    '''
+    Loads a results file of any supported format.
+    The run metadata of columnar files is in df.attrs["metadata"].
+    '''
+    path = resolve_results_path(path)
+    if path.lower().endswith(BINARY_EXTENSION):
+        log = BinaryLog(path)
+        df = log.to_frame()
+        if columns is not None:
+            df = df[columns]
+        df.attrs["metadata"] = log.metadata
+        return df
+    if not is_columnar(path):
+        df = pd.read_csv(path, usecols=columns)
+        df.attrs["metadata"] = {}
+        return df
+
+    pa = require_pyarrow()
+    if path.lower().endswith(".parquet"):
+        table = pa.parquet.read_table(path, columns=columns)
+    else:
+        table = pa.feather.read_table(path, columns=columns)
+    df = table.to_pandas()
+    df.attrs["metadata"] = _decode_metadata(table.schema.metadata)
+    return df
+
+
+def read_metadata(path: str) -> dict:
+    # Run metadata without loading the data ({} for CSV)
+    path = resolve_results_path(path)
+    if path.lower().endswith(BINARY_EXTENSION):
+        return BinaryLog(path).metadata
+    if not is_columnar(path):
+        return {}
+    pa = require_pyarrow()
+    if path.lower().endswith(".parquet"):
+        schema = pa.parquet.read_schema(path)
+    else:
+        schema = pa.ipc.open_file(path).schema
+    return _decode_metadata(schema.metadata)
+
+
+def _decode_metadata(schema_metadata) -> dict:
+    raw = (schema_metadata or {}).get(METADATA_KEY)
+    return json.loads(raw) if raw else {}
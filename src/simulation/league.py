@@ -0,0 +1,197 @@
+from predictors.rng import spawn_seeds
+from .engine import simulate_predictor_vs_player
+from .tournament import PREDICTORS, PLAYERS, build, cell_seeds
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import pandas as pd
+import time
+
+'''
+League
+
+Every predictor and every player is an entrant with an Elo rating.
+Matches are played as round-robin (every pair once) or Swiss rounds
+(entrants with close ratings meet, no rematches while avoidable), each
+round's matches run across worker processes, and ratings are updated
+incrementally after every round, in schedule order so a seeded league
+is reproducible.
+
+A match is num_games rounds of the usual simulation with one entrant on
+the predictor side and the other on the player side. Two predictors play
+each other directly (see arena.py); when both entrants are players, the
+first one takes the predictor side through PlayerSeat. The match score is the share of
+decisive rounds won (0.5 if every round was a tie).
+'''
+
+ELO_START = 1500.0
+ELO_K = 32.0
+
+# Entrant ids are "<kind>:<name>", e.g. "predictor:markov", "player:counter"
+KINDS = {"predictor": PREDICTORS, "player": PLAYERS}
+
+
+class PlayerSeat:
+    # Seats a Player on the predictor side of a match (predict_idx / update_idx)
+    def __init__(self, player):
+        self.player = player
+
+    def predict_idx(self) -> int:
+        return self.player.get_move_idx()
+
+    def update_idx(self, opponent_move: int, own_move: int):
+        self.player.observe_idx(opponent_move)
+
+
+def entrants(predictor_names=None, player_names=None) -> list[str]:
+    predictor_names = list(PREDICTORS) if predictor_names is None else predictor_names
+    player_names = list(PLAYERS) if player_names is None else player_names
+    return [f"predictor:{n}" for n in predictor_names] + [f"player:{n}" for n in player_names]
+
+
+def build_side(entrant: str, side: str, rng):
+    '''
+    Builds an entrant for one side of a match ("model" or "opponent").
+    '''
+    kind, name = entrant.split(":", 1)
+    if kind == "predictor":
+        return build(PREDICTORS, name, rng)
+
+    player = build(PLAYERS, name, rng)
+    return player if side == "opponent" else PlayerSeat(player)
+
+
+def run_match(a: str, b: str, num_games: int, seed: int) -> dict:
+    '''
+    Plays a vs b (in a worker process). A predictor always takes the
+    predictor side, so b is swapped in when only b is a predictor.
+    Returns the result from a's point of view.
+    '''
+    swap = a.startswith("player:") and b.startswith("predictor:")
+    model_entrant, opponent_entrant = (b, a) if swap else (a, b)
+    model_seed, opponent_seed = spawn_seeds(seed, 2)
+    model = build_side(model_entrant, "model", model_seed)
+    opponent = build_side(opponent_entrant, "opponent", opponent_seed)
+
+    start = time.perf_counter()
+    totals = simulate_predictor_vs_player(model, lambda: opponent, num_games=num_games, return_frame=False)
+    wins, losses = totals["model_wins"], totals["player_wins"]
+    if swap:
+        wins, losses = losses, wins
+    return {"a": a, "b": b, "wins": wins, "losses": losses, "ties": totals["ties"],
+            "seed": seed, "seconds": time.perf_counter() - start}
+
+
+def match_score(result: dict) -> float:
+    decisive = result["wins"] + result["losses"]
+    return result["wins"] / decisive if decisive else 0.5
+
+
+def elo_update(ratings: dict, a: str, b: str, score: float, k: float = ELO_K) -> None:
+    expected = 1.0 / (1.0 + 10 ** ((ratings[b] - ratings[a]) / 400.0))
+    delta = k * (score - expected)
+    ratings[a] += delta
+    ratings[b] -= delta
+
+
+def swiss_pairings(ratings: dict, played: set, byes: set = frozenset()) -> tuple[list[tuple[str, str]], str | None]:
+    '''
+    Pairs entrants of adjacent rating, skipping pairs that already met
+    when another partner is available. With an odd count the lowest
+    rated entrant without a bye so far sits the round out.
+    Returns (pairs, bye).
+    '''
+    pool = sorted(ratings, key=lambda e: -ratings[e])
+    bye = None
+    if len(pool) % 2:
+        bye = next((e for e in reversed(pool) if e not in byes), pool[-1])
+        pool.remove(bye)
+    pairs = []
+    while len(pool) > 1:
+        a = pool.pop(0)
+        partner = next((b for b in pool if frozenset((a, b)) not in played), pool[0])
+        pool.remove(partner)
+        pairs.append((a, partner))
+    return pairs, bye
+
+
+class League:
+    '''
+    league = League(entrants(), num_games=20000, seed=42)
+    league.round_robin()   # or league.swiss(rounds=5)
+    league.leaderboard()
+    '''
+
+    def __init__(self, entrant_ids: list[str], num_games: int = 20000,
+                 workers: int | None = None, seed: int | None = None, k: float = ELO_K):
+        self.entrants = list(entrant_ids)
+        self.num_games = num_games
+        self.workers = workers
+        self.seed = seed
+        self.k = k
+        self.ratings = {e: ELO_START for e in self.entrants}
+        self.results = []
+        self.played = set()
+        self.byes = set()
+        self._rounds = 0
+
+    def play_round(self, pairs: list[tuple[str, str]]) -> list[dict]:
+        # Plays the pairs in parallel, then rates them in pairing order
+        self._rounds += 1
+        root = None if self.seed is None else [self.seed, self._rounds]
+        seeds = cell_seeds(root, pairs)
+        jobs = [(a, b, self.num_games, s) for (a, b), s in zip(pairs, seeds)]
+
+        if self.workers == 1:
+            results = [run_match(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(run_match, *zip(*jobs))) if jobs else []
+
+        for result in results:
+            result["round"] = self._rounds
+            result["rating_a_before"] = self.ratings[result["a"]]
+            result["rating_b_before"] = self.ratings[result["b"]]
+            elo_update(self.ratings, result["a"], result["b"], match_score(result), self.k)
+            self.played.add(frozenset((result["a"], result["b"])))
+            self.results.append(result)
+        return results
+
+    def round_robin(self) -> pd.DataFrame:
+        self.play_round(list(combinations(self.entrants, 2)))
+        return self.leaderboard()
+
+    def swiss(self, rounds: int = 5) -> pd.DataFrame:
+        for _ in range(rounds):
+            pairs, bye = swiss_pairings(self.ratings, self.played, self.byes)
+            if bye is not None:
+                self.byes.add(bye)
+            self.play_round(pairs)
+        return self.leaderboard()
+
+    def leaderboard(self) -> pd.DataFrame:
+        rows = {e: {"entrant": e, "rating": self.ratings[e], "matches": 0,
+                    "match_wins": 0, "match_losses": 0, "match_draws": 0,
+                    "round_wins": 0, "round_losses": 0, "round_ties": 0} for e in self.entrants}
+        for r in self.results:
+            score = match_score(r)
+            for me, wins, losses, my_score in ((r["a"], r["wins"], r["losses"], score),
+                                               (r["b"], r["losses"], r["wins"], 1 - score)):
+                row = rows[me]
+                row["matches"] += 1
+                row["round_wins"] += wins
+                row["round_losses"] += losses
+                row["round_ties"] += r["ties"]
+                if my_score > 0.5:
+                    row["match_wins"] += 1
+                elif my_score < 0.5:
+                    row["match_losses"] += 1
+                else:
+                    row["match_draws"] += 1
+
+        board = pd.DataFrame(list(rows.values()))
+        board["rating"] = board["rating"].round(1)
+        return board.sort_values("rating", ascending=False, kind="stable").reset_index(drop=True)
+
+    def matches(self) -> pd.DataFrame:
+        return pd.DataFrame(self.results)
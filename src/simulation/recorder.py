@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+'''
+Columnar round recorder
+
+Stores a simulation as two preallocated int8 move columns
+(R=0, P=1, S=2). Everything else in the CSV schema is derived once at
+the end: results from (model - opponent) % 3, the countered prediction
+from (model - 1) % 3 and the cumulative columns from cumsum.
+'''
+
+# Column order of every results_*.csv
+COLUMNS = [
+    "round",
+    "model_move",
+    "opponent_move",
+    "model_prediction",
+    "result",
+    "cum_model_wins",
+    "cum_player_wins",
+    "cum_ties",
+]
+
+MOVES = ('R', 'P', 'S')
+RESULTS = ('tie', 'win', 'lose')
+
+
+class RoundRecorder:
+    '''
+    Preallocated int8 columns for up to `capacity` rounds.
+
+    recorder = RoundRecorder(num_games)
+    recorder.record(ai_move, player_move)   # once per round
+    df = recorder.to_frame()                # same schema as before
+
+    with_prediction=False leaves model_prediction empty (training logs),
+    result_labels changes the result strings (simulate.py uses 'loss').
+    '''
+
+    def __init__(self, capacity: int,
+                 with_prediction: bool = True,
+                 result_labels: tuple[str, str, str] = RESULTS):
+        self.capacity = capacity
+        self.with_prediction = with_prediction
+        self.result_labels = result_labels
+        self.model_moves = np.empty(capacity, dtype=np.int8)
+        self.opponent_moves = np.empty(capacity, dtype=np.int8)
+        self.n = 0
+
+    @classmethod
+    def from_moves(cls, model_moves: np.ndarray, opponent_moves: np.ndarray, **kwargs) -> "RoundRecorder":
+        # Recorder already holding complete move columns (e.g. a vectorized run)
+        recorder = cls(0, **kwargs)
+        recorder.model_moves = np.asarray(model_moves, dtype=np.int8)
+        recorder.opponent_moves = np.asarray(opponent_moves, dtype=np.int8)
+        recorder.capacity = recorder.n = len(recorder.model_moves)
+        return recorder
+
+    def record(self, model_move: int, opponent_move: int) -> None:
+        n = self.n
+        self.model_moves[n] = model_move
+        self.opponent_moves[n] = opponent_move
+        self.n = n + 1
+
+    def extend(self, model_moves: np.ndarray, opponent_moves: np.ndarray) -> None:
+        n, k = self.n, len(model_moves)
+        self.model_moves[n:n + k] = model_moves
+        self.opponent_moves[n:n + k] = opponent_moves
+        self.n = n + k
+
+    def __len__(self) -> int:
+        return self.n
+
+    # Integer result codes (0 tie, 1 win, 2 lose) of the recorded rounds from `start`
+    def results(self, start: int = 0) -> np.ndarray:
+        return (self.model_moves[start:self.n] - self.opponent_moves[start:self.n]) % 3
+
+    # Final (wins, losses, ties) of the model
+    def totals(self) -> tuple[int, int, int]:
+        counts = np.bincount(self.results(), minlength=3)
+        return int(counts[1]), int(counts[2]), int(counts[0])
+
+    def to_frame(self, categorical: bool = False) -> pd.DataFrame:
+        return frame_from_moves(self.model_moves[:self.n], self.opponent_moves[:self.n],
+                                with_prediction=self.with_prediction,
+                                result_labels=self.result_labels,
+                                categorical=categorical)
+
+    def to_csv(self, path: str) -> pd.DataFrame:
+        df = self.to_frame()
+        df.to_csv(path, index=False)
+        return df
+
+
+def frame_from_moves(model_moves: np.ndarray, opponent_moves: np.ndarray,
+                     with_prediction: bool = True,
+                     result_labels: tuple[str, str, str] = RESULTS,
+                     start_round: int = 1,
+                     start_totals: tuple[int, int, int] = (0, 0, 0),
+                     categorical: bool = False) -> pd.DataFrame:
+    '''
+    Builds the results CSV schema from integer move columns.
+    start_round / start_totals (wins, losses, ties) continue the round
+    and cumulative columns of earlier chunks of the same run.
+    categorical=True makes the move/result columns categoricals over the
+    integer codes instead of object strings (columnar formats).
+    '''
+    n = len(model_moves)
+    results = (model_moves - opponent_moves) % 3
+
+    if categorical:
+        def labelled(codes, labels):
+            return pd.Categorical.from_codes(codes, categories=list(labels))
+    else:
+        def labelled(codes, labels):
+            return np.array(labels, dtype=object)[codes]
+
+    if with_prediction:
+        prediction = labelled((model_moves + 2) % 3, MOVES)
+    else:
+        prediction = labelled(np.full(n, -1, dtype=np.int8), MOVES) if categorical else np.full(n, None, dtype=object)
+
+    return pd.DataFrame({
+        "round": np.arange(start_round, start_round + n, dtype=np.int32),
+        "model_move": labelled(model_moves, MOVES),
+        "opponent_move": labelled(opponent_moves, MOVES),
+        "model_prediction": prediction,
+        "result": labelled(results, result_labels),
+        "cum_model_wins": np.cumsum(results == 1, dtype=np.int32) + start_totals[0],
+        "cum_player_wins": np.cumsum(results == 2, dtype=np.int32) + start_totals[1],
+        "cum_ties": np.cumsum(results == 0, dtype=np.int32) + start_totals[2],
+    }, columns=COLUMNS)
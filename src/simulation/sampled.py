@@ -0,0 +1,272 @@
+from predictors.base_predictor import RPSPredictor
+from .recorder import RESULTS, frame_from_moves
+from .csv_writer import CHUNK_SIZE
+from .formats import load_results, resolve_results_path
+
+import numpy as np
+import pandas as pd
+import os
+
+'''
+Sampled logging
+
+Long runs rarely need every row: the plots downsample to every 100th
+round and smooth over hundreds of rounds anyway. A SampledCSVWriter
+keeps two small files instead of the full results CSV:
+
+  results_x_vs_y.csv         every `every`-th row (rounds 1, every+1, ...)
+                             in the usual schema, cumulative columns exact
+  results_x_vs_y.blocks.csv  one row per block of `block` rounds: wins,
+                             losses, ties, prediction accuracy and the
+                             move histograms of both sides
+
+With every=block=100 that is 1/30 of the full CSV (1/100 and less with
+larger blocks), and rolling
+win rates can still be rebuilt from the blocks (rolling_win_rate).
+load_rolling gives the plots the same rolling counts and run totals
+from either kind of results file.
+'''
+
+BLOCK_COLUMNS = [
+    "block",
+    "start_round",
+    "end_round",
+    "wins",
+    "losses",
+    "ties",
+    "accuracy",
+    "model_R",
+    "model_P",
+    "model_S",
+    "opponent_R",
+    "opponent_P",
+    "opponent_S",
+    "cum_model_wins",
+    "cum_player_wins",
+    "cum_ties",
+]
+
+
+def blocks_path(path: str) -> str:
+    # results_x_vs_y.csv -> results_x_vs_y.blocks.csv
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.blocks{ext}"
+
+
+def block_frame(model_moves: np.ndarray, opponent_moves: np.ndarray, block: int,
+                start_block: int = 0, start_round: int = 1,
+                start_totals: tuple[int, int, int] = (0, 0, 0)) -> pd.DataFrame:
+    '''
+    Per-block aggregates of the moves, block rows of `block` rounds (the
+    last one may be shorter). start_* continue an earlier part of the run.
+    '''
+    model_moves = np.asarray(model_moves, dtype=np.int64)
+    opponent_moves = np.asarray(opponent_moves, dtype=np.int64)
+    n = len(model_moves)
+    n_blocks = -(-n // block)
+    ids = np.arange(n) // block
+    results = (model_moves - opponent_moves) % 3
+
+    def per_block(mask):
+        return np.bincount(ids[mask], minlength=n_blocks)
+
+    sizes = np.bincount(ids, minlength=n_blocks)
+    wins, losses, ties = per_block(results == 1), per_block(results == 2), per_block(results == 0)
+    model_hist = np.bincount(ids * 3 + model_moves, minlength=n_blocks * 3).reshape(n_blocks, 3)
+    opponent_hist = np.bincount(ids * 3 + opponent_moves, minlength=n_blocks * 3).reshape(n_blocks, 3)
+    starts = start_round + np.arange(n_blocks) * block
+
+    return pd.DataFrame({
+        "block": start_block + np.arange(n_blocks),
+        "start_round": starts,
+        "end_round": starts + sizes - 1,
+        "wins": wins,
+        "losses": losses,
+        "ties": ties,
+        # The model plays the counter of its prediction, so a correct prediction is a win
+        "accuracy": np.round(wins / np.maximum(sizes, 1), 4),
+        "model_R": model_hist[:, 0],
+        "model_P": model_hist[:, 1],
+        "model_S": model_hist[:, 2],
+        "opponent_R": opponent_hist[:, 0],
+        "opponent_P": opponent_hist[:, 1],
+        "opponent_S": opponent_hist[:, 2],
+        "cum_model_wins": np.cumsum(wins) + start_totals[0],
+        "cum_player_wins": np.cumsum(losses) + start_totals[1],
+        "cum_ties": np.cumsum(ties) + start_totals[2],
+    }, columns=BLOCK_COLUMNS)
+
+
+def rolling_counts(blocks: pd.DataFrame, window: int) -> pd.DataFrame:
+    # wins / losses / ties / rounds over the last `window` rounds (rounded to whole blocks)
+    size = max(int(blocks["end_round"].iloc[0] - blocks["start_round"].iloc[0] + 1), 1) if len(blocks) else 1
+    n = max(window // size, 1)
+    rounds = blocks["end_round"] - blocks["start_round"] + 1
+    return pd.DataFrame({"wins": blocks["wins"], "losses": blocks["losses"],
+                         "ties": blocks["ties"], "rounds": rounds}).rolling(n, min_periods=1).sum()
+
+
+def rolling_win_rate(blocks: pd.DataFrame, window: int) -> pd.Series:
+    '''
+    W / (W + L) over the last `window` rounds (rounded to whole blocks),
+    indexed like `blocks`; the block log's stand-in for
+    df["is_win"].rolling(window) on the full results.
+    '''
+    counts = rolling_counts(blocks, window)
+    decisive = counts["wins"] + counts["losses"]
+    return (counts["wins"] / decisive.replace(0, np.nan)).fillna(0)
+
+
+def load_rolling(path: str, window: int, every: int = 1) -> tuple[pd.DataFrame, dict]:
+    '''
+    What the plots need from a results file, whether it holds every row
+    or was logged sampled (then read from its blocks file):
+
+    rolling: round, wins, losses, ties, rounds over the last `window`
+             rounds, one row about every `every` rounds
+    totals:  rounds, wins, losses, ties of the whole run
+    '''
+    path = resolve_results_path(path)
+    df = load_results(path, columns=["round", "model_move", "opponent_move"])
+    sampled = len(df) > 1 and df["round"].iloc[1] - df["round"].iloc[0] > 1
+    if not sampled:
+        results = RPSPredictor.get_results_batch(df["opponent_move"], df["model_move"])
+        per_round = pd.DataFrame({"wins": results == RPSPredictor.WIN, "losses": results == RPSPredictor.LOSE,
+                                  "ties": results == RPSPredictor.TIE}).astype(int)
+        per_round["rounds"] = 1
+        # Same NaN warm-up as df[...].rolling(window) on the full rows
+        rolling = per_round.rolling(window).sum()
+        rolling.insert(0, "round", df["round"])
+        totals = per_round.sum()
+        return rolling.iloc[::every].reset_index(drop=True), {name: int(totals[name]) for name in per_round}
+
+    blocks = pd.read_csv(blocks_path(path))
+    size = max(int(blocks["end_round"].iloc[0] - blocks["start_round"].iloc[0] + 1), 1) if len(blocks) else 1
+    rolling = rolling_counts(blocks, window)
+    rolling.insert(0, "round", blocks["end_round"])
+    last = blocks.iloc[-1] if len(blocks) else None
+    totals = {"wins": int(last["cum_model_wins"]), "losses": int(last["cum_player_wins"]),
+              "ties": int(last["cum_ties"]), "rounds": int(last["end_round"])} if last is not None else \
+             {"wins": 0, "losses": 0, "ties": 0, "rounds": 0}
+    return rolling.iloc[::max(every // size, 1)].reset_index(drop=True), totals
+
+
+class SampledCSVWriter:
+    '''
+    Same interface as ChunkedCSVWriter, writing the sampled rows to
+    `path` and the block aggregates to blocks_path(path).
+
+    with SampledCSVWriter(path, every=100) as writer:
+        writer.write(model_moves, opponent_moves)
+
+    block: rounds per aggregate row (default: every). A trailing partial
+    block is written when the writer is closed.
+    '''
+
+    def __init__(self, path: str, every: int = 100, block: int | None = None,
+                 flush_every: int | None = None,
+                 with_prediction: bool = True,
+                 result_labels: tuple[str, str, str] = RESULTS,
+                 resume_from: dict | None = None):
+        if every < 1 or (block is not None and block < 1):
+            raise ValueError(f"every and block must be positive, got every={every}, block={block}.")
+        self.path = path
+        self.blocks_path = blocks_path(path)
+        self.every = every
+        self.block = block or every
+        self.flush_every = flush_every
+        self.with_prediction = with_prediction
+        self.result_labels = result_labels
+        self.rounds = 0
+        self.totals = (0, 0, 0)         # wins, losses, ties so far
+        self.block_totals = (0, 0, 0)   # the same, up to the last complete block
+        self._pending = (np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int8))
+        self._unflushed = 0
+
+        os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
+        if resume_from is None:
+            self.file = open(path, "w", newline="")
+            self.blocks_file = open(self.blocks_path, "w", newline="")
+            pd.DataFrame(columns=BLOCK_COLUMNS).to_csv(self.blocks_file, index=False)
+        else:
+            os.truncate(path, resume_from["offset"])
+            os.truncate(self.blocks_path, resume_from["blocks_offset"])
+            self.rounds = resume_from["rounds"]
+            self.totals = tuple(resume_from["totals"])
+            self.block_totals = tuple(resume_from["block_totals"])
+            self._pending = tuple(np.array(moves, dtype=np.int8) for moves in resume_from["pending"])
+            self.file = open(path, "a", newline="")
+            self.blocks_file = open(self.blocks_path, "a", newline="")
+
+    def write(self, model_moves: np.ndarray, opponent_moves: np.ndarray) -> None:
+        n = len(model_moves)
+        if n == 0 and self.rounds > 0:
+            return
+        df = frame_from_moves(model_moves, opponent_moves,
+                              with_prediction=self.with_prediction,
+                              result_labels=self.result_labels,
+                              start_round=self.rounds + 1,
+                              start_totals=self.totals)
+        df[(df["round"] - 1) % self.every == 0].to_csv(self.file, header=self.rounds == 0, index=False)
+        if n:
+            last = df.iloc[-1]
+            self.totals = (int(last["cum_model_wins"]), int(last["cum_player_wins"]), int(last["cum_ties"]))
+        self.rounds += n
+
+        # Only complete blocks are written, the rest waits for the next call
+        model_moves = np.concatenate((self._pending[0], model_moves))
+        opponent_moves = np.concatenate((self._pending[1], opponent_moves))
+        complete = len(model_moves) // self.block * self.block
+        self._write_blocks(model_moves[:complete], opponent_moves[:complete])
+        self._pending = (model_moves[complete:], opponent_moves[complete:])
+
+        self._unflushed += n
+        if self.flush_every is None or self._unflushed >= self.flush_every:
+            self.flush()
+
+    def write_chunked(self, model_moves: np.ndarray, opponent_moves: np.ndarray,
+                      chunk_size: int = CHUNK_SIZE) -> None:
+        for start in range(0, max(len(model_moves), 1), chunk_size):
+            self.write(model_moves[start:start + chunk_size], opponent_moves[start:start + chunk_size])
+
+    def _write_blocks(self, model_moves: np.ndarray, opponent_moves: np.ndarray) -> None:
+        if len(model_moves) == 0:
+            return
+        start_round = self._block_start()
+        blocks = block_frame(model_moves, opponent_moves, self.block,
+                             start_block=(start_round - 1) // self.block,
+                             start_round=start_round, start_totals=self.block_totals)
+        blocks.to_csv(self.blocks_file, header=False, index=False)
+        last = blocks.iloc[-1]
+        self.block_totals = (int(last["cum_model_wins"]), int(last["cum_player_wins"]), int(last["cum_ties"]))
+
+    def _block_start(self) -> int:
+        # First round not yet in the blocks file
+        return self.block_totals[0] + self.block_totals[1] + self.block_totals[2] + 1
+
+    def flush(self) -> None:
+        self.file.flush()
+        self.blocks_file.flush()
+        self._unflushed = 0
+
+    def checkpoint_state(self) -> dict:
+        # Flushes and returns what resume_from needs to continue these files
+        self.flush()
+        return {"rounds": self.rounds, "totals": self.totals, "block_totals": self.block_totals,
+                "pending": tuple(moves.tolist() for moves in self._pending),
+                "offset": os.path.getsize(self.path), "blocks_offset": os.path.getsize(self.blocks_path)}
+
+    def close(self) -> None:
+        if self.file.closed:
+            return
+        model_moves, opponent_moves = self._pending
+        self._write_blocks(model_moves, opponent_moves)
+        self._pending = (model_moves[:0], opponent_moves[:0])
+        self.file.close()
+        self.blocks_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,74 @@
+import json
+import os
+
+'''
+Cost-aware scheduling
+
+Grid cells are far from equal: a Q-learning cell trains for
+TRAINING_EPISODES before its evaluation rounds, a random-predictor cell
+is almost free. Submitted in grid order, the expensive cells can end up
+last and leave most cores idle at the tail.
+
+Every run records how long each job took (<output_dir>/.cache/timings.json).
+The next run estimates each job from those timings, scaled by its round
+count, and submits the longest first (LPT). Jobs never timed before go
+first, since nothing says they are cheap. The pool then finishes close
+to max(total work / workers, longest job).
+'''
+
+TIMINGS_FILE = os.path.join(".cache", "timings.json")
+
+
+class TimingStore:
+    '''
+    timings = TimingStore(output_dir)
+    timings.estimate("qlearning_vs_random", 100000)   # seconds, None if never run
+    timings.record("qlearning_vs_random", 12.3, 100000)
+    timings.save()
+    '''
+
+    def __init__(self, output_dir: str):
+        self.path = os.path.join(output_dir, TIMINGS_FILE)
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self.entries = json.load(f)
+
+    def estimate(self, job: str, num_games: int) -> float | None:
+        entry = self.entries.get(job)
+        if entry is None or not entry["num_games"]:
+            return None
+        return entry["seconds"] * num_games / entry["num_games"]
+
+    def record(self, job: str, seconds: float, num_games: int) -> None:
+        self.entries[job] = {"seconds": seconds, "num_games": num_games}
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def longest_first(jobs: list, estimates: list[float | None]) -> list:
+    # Jobs sorted by estimated cost, unknown costs first; stable for equal estimates
+    order = sorted(range(len(jobs)),
+                   key=lambda i: -float("inf") if estimates[i] is None else -estimates[i])
+    return [jobs[i] for i in order]
+
+
+def utilization(durations: list[float], elapsed: float, workers: int) -> dict:
+    '''
+    How well the pool was used: busy is the summed job time, ideal the
+    best possible wall time, max(busy / workers, longest job).
+    '''
+    busy = sum(durations)
+    ideal = max(busy / workers, max(durations, default=0.0))
+    return {
+        "workers": workers,
+        "busy": busy,
+        "elapsed": elapsed,
+        "ideal": ideal,
+        "utilization": busy / (elapsed * workers) if elapsed > 0 else 0.0,
+    }
@@ -0,0 +1,59 @@
+import math
+
+'''
+Early stopping
+
+Rounds are only worth playing while they still move the estimate. A
+WilsonStop rule tracks the Wilson score interval of the model's per-round
+win rate (ties count as non-wins, so all-tie pairings converge too) and
+says stop once the interval is narrower than `width`.
+
+simulate_predictor_vs_player(..., num_games=100000, early_stop=WilsonStop(width=0.02))
+plays at most 100000 rounds and reports the round it stopped at.
+'''
+
+Z_95 = 1.959963984540054
+
+
+def wilson_interval(successes: int, n: int, z: float = Z_95) -> tuple[float, float]:
+    # Wilson score interval of a binomial proportion, (0, 1) without data
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    z2 = z * z
+    center = (p + z2 / (2 * n)) / (1 + z2 / n)
+    half = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / (1 + z2 / n)
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+class WilsonStop:
+    '''
+    Stop rule: interval width < `width` at confidence z (default 95%).
+    Checked every `check_every` rounds once `min_rounds` were played.
+    The rule holds no run state, so one instance can be shared by runs.
+    '''
+
+    def __init__(self, width: float = 0.02, z: float = Z_95,
+                 min_rounds: int = 1000, check_every: int = 1000):
+        if not 0 < width < 1:
+            raise ValueError(f"width must be between 0 and 1, got {width}.")
+        self.width = width
+        self.z = z
+        self.min_rounds = min_rounds
+        self.check_every = check_every
+
+    def interval(self, wins: int, rounds: int) -> tuple[float, float]:
+        return wilson_interval(wins, rounds, self.z)
+
+    def satisfied(self, wins: int, rounds: int) -> bool:
+        if rounds < self.min_rounds:
+            return False
+        low, high = self.interval(wins, rounds)
+        return high - low < self.width
+
+    # Condition for the streaming EarlyStop sink: EarlyStop(stats, rule.condition, ...)
+    def condition(self, stats) -> bool:
+        return self.satisfied(stats.wins, stats.rounds)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(width={self.width}, z={self.z:.3f}, min_rounds={self.min_rounds}, check_every={self.check_every})"
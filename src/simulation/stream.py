@@ -0,0 +1,213 @@
+from .recorder import RESULTS, RoundRecorder
+from .csv_writer import CHUNK_SIZE, ChunkedCSVWriter
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+'''
+Streaming simulation
+
+iter_rounds() plays a predictor against a player lazily, one compact
+record per round, so nothing is materialized unless a consumer keeps it.
+Sinks consume the stream (CSV, running stats, live plot, early stop) and
+any of them can end the run early; memory stays constant in num_games.
+
+stats = RunningStats()
+rounds = run_stream(iter_rounds(predictor, player, 10**7),
+                    [stats, CSVSink("results/run.csv"), EarlyStop(stats, min_rounds=1000)])
+'''
+
+
+class Round(NamedTuple):
+    # Integer codes: moves R=0, P=1, S=2; result (model side) tie=0, win=1, lose=2
+    round: int
+    model_move: int
+    opponent_move: int
+    result: int
+
+
+def iter_rounds(predictor, player, n: int | None = None) -> Iterator[Round]:
+    '''
+    Yields n rounds of predictor vs player (forever if n is None).
+    Agents are only advanced as records are pulled, so closing the
+    generator stops the match where the consumer left it.
+    '''
+    predict, update = predictor.predict_idx, predictor.update_idx
+    get_move, observe = player.get_move_idx, player.observe_idx
+
+    i = 0
+    while n is None or i < n:
+        ai_move = predict()
+        p_move = get_move()
+        update(p_move, ai_move)
+        observe(ai_move)
+        i += 1
+        yield Round(i, ai_move, p_move, (ai_move - p_move) % 3)
+
+
+class Sink(ABC):
+    '''
+    Consumer of a round stream.
+    push() returns True to ask run_stream to stop after this round.
+    '''
+
+    @abstractmethod
+    def push(self, record: Round) -> bool | None:
+        pass
+
+    def close(self):
+        pass
+
+
+def run_stream(rounds: Iterable[Round], sinks: list[Sink]) -> int:
+    '''
+    Feeds every round to every sink until the stream ends or a sink asks
+    to stop, then closes the sinks. Returns the number of rounds consumed.
+    '''
+    consumed = 0
+    try:
+        for record in rounds:
+            consumed += 1
+            stop = False
+            for sink in sinks:
+                if sink.push(record):
+                    stop = True
+            if stop:
+                break
+    finally:
+        if hasattr(rounds, "close"):
+            rounds.close()
+        for sink in sinks:
+            sink.close()
+    return consumed
+
+
+class RunningStats(Sink):
+    # Running totals of the model's results and both sides' move counts
+    def __init__(self):
+        self.rounds = 0
+        self.results = [0, 0, 0]          # tie, win, lose
+        self.model_moves = [0, 0, 0]
+        self.opponent_moves = [0, 0, 0]
+
+    def push(self, record: Round):
+        self.rounds += 1
+        self.results[record.result] += 1
+        self.model_moves[record.model_move] += 1
+        self.opponent_moves[record.opponent_move] += 1
+
+    @property
+    def wins(self) -> int:
+        return self.results[1]
+
+    @property
+    def losses(self) -> int:
+        return self.results[2]
+
+    @property
+    def ties(self) -> int:
+        return self.results[0]
+
+    # Model wins over decisive rounds (ties excluded), like the tournament summary
+    @property
+    def win_rate(self) -> float:
+        decisive = self.wins + self.losses
+        return self.wins / decisive if decisive else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "model_wins": self.wins,
+            "player_wins": self.losses,
+            "ties": self.ties,
+            "win_rate": round(self.win_rate, 3),
+        }
+
+
+class CSVSink(Sink):
+    '''
+    Writes the stream in the results CSV format, chunk_size rounds at a
+    time through ChunkedCSVWriter.
+    '''
+
+    def __init__(self, path: str, result_labels: tuple[str, str, str] = RESULTS,
+                 chunk_size: int = CHUNK_SIZE, flush_every: int | None = None):
+        self.writer = ChunkedCSVWriter(path, flush_every=flush_every, result_labels=result_labels)
+        self.buffer = RoundRecorder(chunk_size)
+
+    def push(self, record: Round):
+        buffer = self.buffer
+        buffer.record(record.model_move, record.opponent_move)
+        if buffer.n == buffer.capacity:
+            self._drain()
+
+    def _drain(self):
+        buffer = self.buffer
+        self.writer.write(buffer.model_moves[:buffer.n], buffer.opponent_moves[:buffer.n])
+        buffer.n = 0
+
+    def close(self):
+        if self.buffer.n or self.writer.rounds == 0:
+            self._drain()
+        self.writer.close()
+
+
+class EarlyStop(Sink):
+    '''
+    Stops the run once `condition(stats)` holds, checked every
+    `check_every` rounds after `min_rounds`. `stats` is a RunningStats
+    that must also be in the sink list (before this one).
+    Without a condition it stops after min_rounds.
+    '''
+
+    def __init__(self, stats: RunningStats,
+                 condition: Callable[[RunningStats], bool] | None = None,
+                 min_rounds: int = 0, check_every: int = 1):
+        self.stats = stats
+        self.condition = condition
+        self.min_rounds = min_rounds
+        self.check_every = check_every
+        self.stopped_at = None
+
+    def push(self, record: Round) -> bool:
+        n = record.round
+        if n < self.min_rounds or n % self.check_every:
+            return False
+        if self.condition is None or self.condition(self.stats):
+            self.stopped_at = n
+            return True
+        return False
+
+
+class LivePlot(Sink):
+    '''
+    Redraws the model's cumulative win rate every `every` rounds
+    (matplotlib interactive mode).
+    '''
+
+    def __init__(self, stats: RunningStats, every: int = 1000, title: str = "Model win rate"):
+        import matplotlib.pyplot as plt
+
+        self.plt = plt
+        self.stats = stats
+        self.every = every
+        self.xs, self.ys = [], []
+        plt.ion()
+        self.fig, self.ax = plt.subplots()
+        self.line, = self.ax.plot([], [])
+        self.ax.set_title(title)
+        self.ax.set_xlabel("Round")
+        self.ax.set_ylabel("Win rate (decisive rounds)")
+        self.ax.set_ylim(0, 1)
+
+    def push(self, record: Round):
+        if record.round % self.every:
+            return
+        self.xs.append(record.round)
+        self.ys.append(self.stats.win_rate)
+        self.line.set_data(self.xs, self.ys)
+        self.ax.set_xlim(0, record.round)
+        self.plt.pause(0.001)
+
+    def close(self):
+        self.plt.ioff()
@@ -0,0 +1,132 @@
+from contextlib import contextmanager
+
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+'''
+Telemetry
+
+Where a run spends its time. With telemetry on, the engine plays the
+round loop through a timed copy that reads perf_counter_ns around every
+call, and times the per-block work (vectorized batches, output writes,
+checkpoints, building the frame) as a whole:
+
+  predict    predictor.predict_idx
+  get_move   player.get_move_idx (the second predictor in an arena run)
+  record     RoundRecorder.record
+  update     predictor.update_idx
+  observe    player.observe_idx (the second predictor's update_idx)
+  vectorized whole vectorized batches
+  write      results file output
+  checkpoint checkpoint saves
+  frame      building the returned / columnar DataFrame
+
+Without telemetry the untimed loop runs, so it costs nothing when off;
+when on, the clock reads add about 1.5 us per round (~15% of a Markov
+vs Counter run), so compare phases against each other rather than
+against untimed runs.
+'''
+
+ROUND_PHASES = ("predict", "get_move", "record", "update", "observe")
+
+
+def sidecar_path(path: str) -> str:
+    # results_x_vs_y.csv -> results_x_vs_y.telemetry.json
+    stem, _ = os.path.splitext(path)
+    return f"{stem}.telemetry.json"
+
+
+def peak_rss() -> int | None:
+    # Peak resident set size of this process in bytes (None where unavailable).
+    # A lifetime high-water mark: in a reused pool worker it may come from an
+    # earlier cell, see Telemetry's peak_rss_growth_bytes
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Telemetry:
+    '''
+    telemetry = Telemetry()
+    simulate_predictor_vs_player(..., telemetry=telemetry)
+    telemetry.as_dict()     # rounds/sec, ns per phase, peak RSS (and its growth in this run)
+
+    verbose: print the report at the end of the run.
+    sidecar: write it as JSON next to the run's output file (sidecar_path).
+    '''
+
+    def __init__(self, verbose: bool = True, sidecar: bool = False):
+        self.verbose = verbose
+        self.sidecar = sidecar
+        self.ns = {}
+        self.rounds = 0
+        self.seconds = 0.0
+        self._start = None
+        self._start_rss = None
+
+    def add(self, phase: str, ns: int) -> None:
+        self.ns[phase] = self.ns.get(phase, 0) + ns
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start)
+
+    def start(self) -> None:
+        self._start = time.perf_counter()
+        self._start_rss = peak_rss()
+
+    def stop(self, rounds: int) -> None:
+        self.seconds = time.perf_counter() - self._start
+        self.rounds = rounds
+
+    def as_dict(self) -> dict:
+        timed = sum(self.ns.values())
+        peak = peak_rss()
+        return {
+            "rounds": self.rounds,
+            "seconds": self.seconds,
+            "rounds_per_sec": self.rounds / self.seconds if self.seconds > 0 else None,
+            "phases": {name: {"ns_total": ns,
+                              "ns_per_round": ns / self.rounds if self.rounds else None,
+                              "share": ns / timed if timed else None}
+                       for name, ns in self.ns.items()},
+            # Process high-water mark, and how far this run raised it (0 if it
+            # stayed under an earlier run's peak in the same worker)
+            "peak_rss_bytes": peak,
+            "peak_rss_growth_bytes": peak - self._start_rss if peak is not None and self._start_rss is not None else None,
+        }
+
+    def report(self) -> str:
+        stats = self.as_dict()
+        rate = f"{stats['rounds_per_sec']:,.0f} rounds/s" if stats["rounds_per_sec"] else "-"
+        lines = [f"{self.rounds} rounds in {self.seconds:.2f}s ({rate})"]
+        if stats["peak_rss_bytes"] is not None:
+            lines[0] += f", peak RSS {stats['peak_rss_bytes'] / 2**20:.1f} MB"
+        if stats["peak_rss_growth_bytes"] is not None:
+            lines[0] += f" (+{stats['peak_rss_growth_bytes'] / 2**20:.1f} MB in this run)"
+        for name, phase in stats["phases"].items():
+            per_round = phase["ns_per_round"] or 0
+            lines.append(f"  {name:<10} {per_round:>9,.0f} ns/round  {phase['share']:>6.1%}")
+        return "\n".join(lines)
+
+    def finish(self, rounds: int, path: str | None = None) -> None:
+        # End of a run: stop the clock, print and/or write the sidecar
+        self.stop(rounds)
+        if self.verbose:
+            print(self.report())
+        if self.sidecar and path:
+            with open(sidecar_path(path), "w") as f:
+                json.dump(self.as_dict(), f, indent=1)
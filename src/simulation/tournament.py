@@ -0,0 +1,352 @@
+from players.counter_move_player import CounterMovePlayer
+from players.random_player import RandomPlayer
+from players.markov_player import MarkovPlayer
+from players.repeater_player import RepeaterPlayer
+from players.fizzbuzz_player import FizzBuzzPlayer
+from players.slight_bias_player import SlightBiasPlayer
+from predictors.random_predictor import RandomPredictor
+from predictors.markov_predictor import MarkovPredictor
+from predictors.qlearning_predictor import QLearningPredictor
+from predictors.backoff_markov_predictor import BackoffMarkovPredictor
+from predictors.rng import spawn_seeds
+from .engine import simulate_predictor_vs_player
+from .formats import require_pyarrow, write_results
+from .stopping import WilsonStop
+from .cache import ResultCache, cell_key
+from .sampled import blocks_path
+from .telemetry import Telemetry
+from .scheduler import TimingStore, longest_first, utilization
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+import hashlib
+import os
+import time
+
+'''
+Tournament runner
+
+Runs every (predictor, player) cell of the grid in a process pool.
+Each cell gets its own seed (derived from the root seed and the cell's
+names, see cell_seeds), builds its agents inside the worker and
+writes its own CSV; the parent only collects the summaries. Every agent
+of a cell draws from its own child stream of the cell seed, nothing
+touches the global random state.
+'''
+
+# name -> (class, kwargs). Plain classes and dicts so cells can be
+# pickled to the workers (lambdas can't).
+PREDICTORS = {
+    "random": (RandomPredictor, {}),
+    "markov": (MarkovPredictor, {"order": 3}),
+    "qlearning": (QLearningPredictor, {"gamma": 0.9, "decay_rate": 0.999, "verbose": False}),
+    # Orders 1..6 in one table set, see backoff_markov_predictor.py
+    "backoff": (BackoffMarkovPredictor, {"order": 6}),
+}
+
+PLAYERS = {
+    "random": (RandomPlayer, {}),
+    "repeater": (RepeaterPlayer, {}),
+    "counter": (CounterMovePlayer, {}),
+    "fizzbuzz": (FizzBuzzPlayer, {}),
+    "slightbias": (SlightBiasPlayer, {}),
+    "markov": (MarkovPlayer, {"order": 3}),
+}
+
+# Output format -> file extension (see formats.py)
+FORMATS = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather", "binary": ".rpsb"}
+
+# Predictors that also get a cell against a copy of themselves
+SELF_PLAY = ("qlearning",)
+
+TRAINING_EPISODES = 10000
+WARMUP_ROUNDS = 10000
+# Exploration both self-play copies keep after the warmup; fully greedy
+# copies can settle into one move pair and tie every round
+SELF_PLAY_EPSILON = 0.05
+
+
+def build(registry: dict, name: str, rng=None):
+    cls, kwargs = registry[name]
+    return cls(**kwargs, rng=rng)
+
+
+def grid_cells(predictor_names=None, player_names=None) -> list[tuple[str, str]]:
+    '''
+    All (predictor, opponent) cells to run, in grid order.
+    Self-play cells use the predictor's name as the opponent.
+    '''
+    predictor_names = list(PREDICTORS) if predictor_names is None else predictor_names
+    player_names = list(PLAYERS) if player_names is None else player_names
+
+    cells = []
+    for p_name in predictor_names:
+        if p_name in SELF_PLAY:
+            cells.append((p_name, p_name))
+        for pl_name in player_names:
+            cells.append((p_name, pl_name))
+    return cells
+
+
+def cell_seeds(seed: int | list[int] | None, cells: list[tuple[str, str]]) -> list[int]:
+    # One seed per cell, from the root seed and the cell's names, so a
+    # matchup plays the same rounds whichever other cells are selected
+    if seed is None:
+        return [int(child.generate_state(1)[0]) for child in spawn_seeds(None, len(cells))]
+    root = list(seed) if isinstance(seed, (list, tuple)) else [seed]
+    return [int(np.random.SeedSequence(root + _name_words(p_name, pl_name)).generate_state(1)[0])
+            for p_name, pl_name in cells]
+
+
+def _name_words(*names: str) -> list[int]:
+    # Stable 32-bit words of the names (hash() is salted per process)
+    digest = hashlib.sha256("\0".join(names).encode()).digest()
+    return [int.from_bytes(digest[i:i + 4], "little") for i in range(0, 16, 4)]
+
+
+def cell_files(p_name: str, pl_name: str, output_dir: str, fmt: str = "csv",
+               sample_every: int | None = None) -> list[str]:
+    # Results file of a cell, its training file (Q-learning cells only)
+    # and, for sampled runs, the block aggregates (see sampled.py)
+    ext = FORMATS[fmt]
+    files = [os.path.join(output_dir, f"results_{p_name}_vs_{pl_name}{ext}"),
+             os.path.join(output_dir, f"training_{p_name}_vs_{pl_name}{ext}")]
+    if sample_every:
+        files.append(blocks_path(files[0]))
+    return files
+
+
+def cell_cache_key(p_name: str, pl_name: str, num_games: int, seed: int,
+                   fmt: str = "csv", ci_width: float | None = None,
+                   sample_every: int | None = None, telemetry: bool = False) -> str:
+    # Cache key of a cell: everything that determines its output, see cache.py.
+    # checkpoint_every / resume are left out: the engine plays the same
+    # rounds however a run is split into checkpoints, and with ci_width it
+    # checks the stop rule at the same rounds (multiples of check_every)
+    p_cls, p_kwargs = PREDICTORS[p_name]
+    if p_name == pl_name and p_name not in PLAYERS:
+        opponent_classes, pl_kwargs = [p_cls], p_kwargs
+    else:
+        opponent_classes, pl_kwargs = [PLAYERS[pl_name][0]], PLAYERS[pl_name][1]
+    config = {
+        "predictor": [p_name, p_kwargs],
+        "player": [pl_name, pl_kwargs],
+        "seed": seed,
+        "num_games": num_games,
+        "format": fmt,
+        "ci_width": ci_width,
+        "sample_every": sample_every,
+        # Timed runs also write a sidecar
+        "telemetry": telemetry,
+        "training_episodes": TRAINING_EPISODES,
+        "warmup_rounds": WARMUP_ROUNDS,
+        "self_play_epsilon": SELF_PLAY_EPSILON,
+    }
+    return cell_key(config, [p_cls] + opponent_classes)
+
+
+def run_cell(p_name: str, pl_name: str, num_games: int, output_dir: str, seed: int,
+             fmt: str = "csv", ci_width: float | None = None,
+             checkpoint_every: int | None = None, resume: bool = False,
+             sample_every: int | None = None, telemetry: bool = False) -> dict:
+    '''
+    Runs one cell of the grid (in a worker process) and writes its
+    results files in `fmt`. With ci_width the cell stops early once the
+    model's win-rate interval is that narrow (num_games is the cap).
+    With checkpoint_every the cell saves a checkpoint under
+    output_dir/checkpoints every that many rounds, and resume=True
+    continues from it (see checkpoint.py), skipping Q-learning training
+    and self-play warmup, whose result the checkpoint already holds. With sample_every (csv only)
+    the results file keeps every sample_every-th row plus block
+    aggregates (see sampled.py). With telemetry the evaluation run is
+    timed per phase and written to a .telemetry.json sidecar.
+    Returns the cell summary.
+    '''
+    early_stop = WilsonStop(ci_width) if ci_width else None
+    checkpoint = None
+    if checkpoint_every:
+        checkpoint = os.path.join(output_dir, "checkpoints", f"{p_name}_vs_{pl_name}.ckpt")
+    resumable = {"checkpoint": checkpoint, "checkpoint_every": checkpoint_every or 1, "resume": resume,
+                 "sample_every": sample_every,
+                 "telemetry": Telemetry(verbose=False, sidecar=True) if telemetry else False}
+    # model, opponent, training opponent (Q-learning cells)
+    model_seed, opponent_seed, extra_seed = spawn_seeds(seed, 3)
+    start = time.perf_counter()
+
+    fname, train_fname = cell_files(p_name, pl_name, output_dir, fmt)[:2]
+    metadata = {"predictor": p_name, "player": pl_name, "seed": seed, "num_games": num_games,
+                "predictor_kwargs": PREDICTORS[p_name][1]}
+    self_play = p_name == pl_name and p_name not in PLAYERS
+    # The evaluation checkpoint holds the trained / warmed-up agents, so a
+    # resumed cell skips training and warmup and keeps its training file
+    resuming = bool(checkpoint) and resume and os.path.exists(checkpoint)
+
+    if self_play:
+        # Two copies learn from each other first, then play on with a little exploration
+        model1 = build(PREDICTORS, p_name, model_seed)
+        model2 = build(PREDICTORS, p_name, opponent_seed)
+        for _ in range(0 if resuming else WARMUP_ROUNDS):
+            m1_move = model1.predict_idx()
+            m2_move = model2.predict_idx()
+            model1.update_idx(m2_move, m1_move)
+            model2.update_idx(m1_move, m2_move)
+            model1.epsilon = 0.0
+            model2.epsilon = 0.0
+        for model in (model1, model2):
+            model.epsilon = SELF_PLAY_EPSILON
+            model.decay_rate = 1.0
+        # Predictor vs predictor, played directly (see arena.py)
+        totals = simulate_predictor_vs_player(model1, lambda: model2, num_games=num_games,
+                                              to_file=fname, metadata=metadata, return_frame=False,
+                                              early_stop=early_stop, **resumable)
+    else:
+        model = build(PREDICTORS, p_name, model_seed)
+        if p_name == "qlearning" and not resuming:
+            train_stats = model.train_against(build(PLAYERS, pl_name, extra_seed), episodes=TRAINING_EPISODES,
+                                              checkpoint=checkpoint and checkpoint + ".training",
+                                              checkpoint_every=checkpoint_every or 1, resume=resume)
+            if train_stats:
+                write_results(pd.DataFrame.from_records(train_stats), train_fname,
+                              {**metadata, "num_games": TRAINING_EPISODES, "training": True})
+        totals = simulate_predictor_vs_player(model, lambda: build(PLAYERS, pl_name, opponent_seed),
+                                              num_games=num_games, to_file=fname, metadata=metadata,
+                                              return_frame=False, early_stop=early_stop, **resumable)
+
+    stats = totals.pop("telemetry", None)
+    if stats:
+        totals["rounds_per_sec"] = stats["rounds_per_sec"]
+    return {
+        "predictor": p_name,
+        "player": pl_name,
+        "seed": seed,
+        **totals,
+        "file": fname,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def run_tournament(predictor_names=None, player_names=None,
+                   num_games: int = 100000,
+                   output_dir: str = "results",
+                   workers: int | None = None,
+                   seed: int | None = None,
+                   fmt: str = "csv",
+                   ci_width: float | None = None,
+                   checkpoint_every: int | None = None,
+                   resume: bool = False,
+                   use_cache: bool = True,
+                   sample_every: int | None = None,
+                   telemetry: bool = False) -> pd.DataFrame:
+    '''
+    Runs the grid across `workers` processes (default: all cores,
+    workers=1 runs inline) and prints a consolidated summary.
+    fmt: results file format, one of FORMATS.
+    ci_width: stop each cell early once its win-rate interval (Wilson,
+    95%) is narrower than this, see stopping.py.
+    checkpoint_every / resume: periodic per-cell checkpoints, and
+    continuing interrupted cells from them (csv and binary formats).
+    use_cache: with a seed, cells whose inputs and sources are unchanged
+    since their files were written are not run again (see cache.py).
+    sample_every: keep every N-th row plus per-block aggregates instead
+    of the full results (csv only, see sampled.py).
+    telemetry: time every cell per phase, with a JSON sidecar next to
+    its results file and rounds/sec in the summary (see telemetry.py).
+    Cells are submitted longest-first by their past timings and the
+    pool's utilization is reported (see scheduler.py), also in
+    summary.attrs["utilization"].
+    Returns the summary as a DataFrame, one row per cell.
+    '''
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Expected one of {list(FORMATS)}.")
+    if fmt in ("parquet", "feather"):
+        require_pyarrow()
+        if checkpoint_every:
+            raise ValueError("Checkpoints need an appendable format (csv or binary).")
+    if sample_every and fmt != "csv":
+        raise ValueError("Sampled logging is only available for the csv format.")
+    os.makedirs(output_dir, exist_ok=True)
+    cells = grid_cells(predictor_names, player_names)
+    seeds = cell_seeds(seed, cells)
+    jobs = [(p_name, pl_name, num_games, output_dir, cell_seed, fmt, ci_width, checkpoint_every, resume, sample_every, telemetry)
+            for (p_name, pl_name), cell_seed in zip(cells, seeds)]
+
+    start = time.perf_counter()
+    by_cell = {}
+
+    # Unseeded runs are never reproducible, so they never hit the cache
+    cache = ResultCache(output_dir) if use_cache and seed is not None else None
+    keys = {}
+    if cache:
+        stale = []
+        for job in jobs:
+            p_name, pl_name, cell_seed = job[0], job[1], job[4]
+            key = cell_cache_key(p_name, pl_name, num_games, cell_seed, fmt, ci_width, sample_every, telemetry)
+            hit = cache.get(f"{p_name}_vs_{pl_name}", key)
+            if hit is None:
+                keys[(p_name, pl_name)] = key
+                stale.append(job)
+            else:
+                by_cell[(p_name, pl_name)] = _report({**hit, "cached": True})
+        jobs = stale
+
+    # Most expensive cells first, so no core is left waiting on a long cell at the end
+    timings = TimingStore(output_dir)
+    jobs = longest_first(jobs, [timings.estimate(f"{job[0]}_vs_{job[1]}", num_games) for job in jobs])
+    durations = []
+
+    def collect(result):
+        cell = (result["predictor"], result["player"])
+        by_cell[cell] = _report({**result, "cached": False})
+        timings.record(f"{cell[0]}_vs_{cell[1]}", result["seconds"], num_games)
+        durations.append(result["seconds"])
+        if cache:
+            cache.put(f"{cell[0]}_vs_{cell[1]}", keys[cell], result,
+                      cell_files(cell[0], cell[1], output_dir, fmt, sample_every))
+
+    if workers == 1 or not jobs:
+        for job in jobs:
+            collect(run_cell(*job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_cell, *job) for job in jobs]
+            for future in as_completed(futures):
+                collect(future.result())
+    elapsed = time.perf_counter() - start
+    if jobs:
+        timings.save()
+
+    # Back in grid order, whatever order the workers finished in
+    summary = pd.DataFrame([by_cell[cell] for cell in cells])
+    decisive = summary["model_wins"] + summary["player_wins"]
+    summary["win_rate"] = (summary["model_wins"] / decisive.replace(0, 1)).round(3)
+
+    print("\n" + "="*50)
+    print(" "* (25 - len("TOURNAMENT SUMMARY")//2) + "TOURNAMENT SUMMARY")
+    print("="*50)
+    columns = ["predictor", "player", "rounds", "model_wins", "player_wins", "ties", "win_rate"]
+    if "rounds_per_sec" in summary:
+        summary["rounds_per_sec"] = summary["rounds_per_sec"].round(0)
+        columns.append("rounds_per_sec")
+    print(summary[columns].to_string(index=False))
+    print(f"\n{len(cells)} cells ({int(summary['cached'].sum())} cached), "
+          f"{summary['rounds'].sum()} rounds in {elapsed:.1f}s")
+    summary.attrs["utilization"] = None
+    if jobs:
+        pool_size = 1 if workers == 1 else min(workers or os.cpu_count() or 1, len(jobs))
+        usage = summary.attrs["utilization"] = utilization(durations, elapsed, pool_size)
+        print(f"{pool_size} workers busy {usage['busy']:.1f}s, utilization {usage['utilization']:.0%} "
+              f"(best possible wall time {usage['ideal']:.1f}s)")
+    return summary
+
+
+def _report(summary: dict) -> dict:
+    print(f"{summary['predictor']} vs {summary['player']}")
+    print(f"  Model wins: {summary['model_wins']} | Player wins: {summary['player_wins']} | Ties: {summary['ties']}")
+    if summary.get("stopped_at"):
+        print(f"  Converged, stopped at round {summary['stopped_at']}")
+    if summary.get("cached"):
+        print(f"  Up to date: {summary['file']} (cached)\n")
+    else:
+        print(f"  Saved to {summary['file']} ({summary['seconds']:.1f}s)\n")
+    return summary
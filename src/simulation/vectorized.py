@@ -0,0 +1,32 @@
+from .recorder import RoundRecorder
+
+import pandas as pd
+
+'''
+Vectorized simulation
+
+When the predictor never looks at the player's moves (predict_batch) and
+the player's moves can be generated from the AI's moves up front
+(get_move_batch), a whole run is two array draws with no per-round loop.
+'''
+
+def is_vectorizable(predictor, player) -> bool:
+    return (callable(getattr(predictor, "predict_batch", None))
+            and callable(getattr(player, "get_move_batch", None)))
+
+
+def play_vectorized(predictor, player, num_games: int) -> RoundRecorder:
+    '''
+    Plays num_games rounds at once and returns them as a filled recorder.
+    The predictor's scoreboard/history and the player's state are
+    advanced as if the rounds had been played one by one.
+    '''
+    ai_moves = predictor.predict_batch(num_games)
+    player_moves = player.get_move_batch(num_games, ai_moves)
+    predictor.update_batch(player_moves, ai_moves)
+    return RoundRecorder.from_moves(ai_moves, player_moves)
+
+
+def simulate_vectorized(predictor, player, num_games: int) -> pd.DataFrame:
+    # Same as play_vectorized, returning the usual results frame
+    return play_vectorized(predictor, player, num_games).to_frame()